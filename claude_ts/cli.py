@@ -2,15 +2,12 @@
 
 import argparse
 import readline  # noqa: F401 — imported for side-effect (enables line editing)
-import subprocess
+import shutil
 import sys
 
-from claude_ts.state import config, SessionState, clean_env, init_language, init_translation_backend, get_ui_string, save_user_config
+from claude_ts.state import config, SessionState, init_language, init_translation_backend, get_ui_string, save_user_config
 from claude_ts.ui import dim, error
-from claude_ts.ollama import _ollama_available, _ollama_list_models
-from claude_ts.executor import process_turn
-from claude_ts.repl import repl
-from claude_ts.setup import select_language
+from claude_ts.executor import process_turn, shutdown_prefetch
 
 
 HELP_EPILOG = """\
@@ -91,6 +88,7 @@ def main():
     elif not init_language():
         # No saved config — first-run setup
         if sys.stdin.isatty():
+            from claude_ts.setup import select_language
             select_language()
         else:
             # Non-interactive: default to Korean for backwards compatibility
@@ -102,6 +100,7 @@ def main():
 
     # Ollama backend setup (CLI flag overrides saved config)
     if args.ollama:
+        from claude_ts.ollama import _ollama_available, _ollama_list_models
         if not _ollama_available():
             error(get_ui_string("ollama_not_installed", "Ollama is not installed. https://ollama.com"))
             sys.exit(1)
@@ -117,26 +116,21 @@ def main():
         config.ollama_model = args.ollama
         save_user_config({"translate_backend": "ollama", "ollama_model": args.ollama})
 
-    # Verify claude is available
-    try:
-        subprocess.run(
-            ["claude", "--version"],
-            capture_output=True,
-            timeout=10,
-            env=clean_env(),
-        )
-    except FileNotFoundError:
+    # Verify claude is available (PATH lookup — no process spawn)
+    if shutil.which("claude") is None:
         error(get_ui_string("claude_not_found", "claude command not found"))
         error("Install: https://docs.anthropic.com/en/docs/claude-code")
         sys.exit(1)
-    except subprocess.TimeoutExpired:
-        pass
 
     # Single-turn mode
     if args.prompt:
         state = SessionState()
-        process_turn(" ".join(args.prompt), state)
+        try:
+            process_turn(" ".join(args.prompt), state)
+        finally:
+            shutdown_prefetch()
         return
 
-    # Interactive REPL mode
+    # Interactive REPL mode (menus, commands and terminal input load only here)
+    from claude_ts.repl import repl
     repl()
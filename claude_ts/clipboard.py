@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import re
 import select
 import shutil
 import subprocess
@@ -13,6 +14,14 @@ from claude_ts.ui import error, dbg
 
 
 IMAGE_EXTS = {".png", ".jpg", ".jpeg", ".gif", ".bmp", ".tiff", ".tif", ".webp", ".svg"}
+_IMAGE_EXTS_TUPLE = tuple(IMAGE_EXTS)  # str.endswith() takes a tuple, not a set
+
+# macOS directories whose files are cleaned up within seconds
+_VOLATILE_RE = re.compile(r"TemporaryItems|NSIRD_screencaptureui")
+
+# AppleScript clipboard classes for image data
+_PNG_MARKER = "\u00abclass PNGf\u00bb"
+_TIFF_MARKER = "\u00abclass TIFF\u00bb"
 
 
 def _clean_path(candidate: str) -> str:
@@ -33,8 +42,7 @@ def _try_image_path(candidate: str) -> str | None:
     path = _clean_path(candidate)
     if not path:
         return None
-    ext = os.path.splitext(path)[1].lower()
-    if ext not in IMAGE_EXTS:
+    if not path.lower().endswith(_IMAGE_EXTS_TUPLE):
         return None
     # File exists — definite match
     if os.path.isfile(path):
@@ -52,6 +60,10 @@ def detect_image_path(text: str) -> str | None:
     Handles multi-line input where the path may be on the first line
     (e.g. pasted path + typed question separated by newlines).
     """
+    # No image extension anywhere — the common case for ordinary pastes
+    lowered = text.lower()
+    if not any(ext in lowered for ext in IMAGE_EXTS):
+        return None
     # Try the whole text first (single-line drag-and-drop)
     result = _try_image_path(text)
     if result:
@@ -71,8 +83,7 @@ def stabilize_image_path(path: str) -> str:
     /var/folders/.../TemporaryItems/NSIRD_screencaptureui_*/ and get cleaned up
     within seconds. Copy to our own temp file to prevent loss.
     """
-    volatile_markers = ("TemporaryItems", "NSIRD_screencaptureui")
-    if any(m in path for m in volatile_markers):
+    if _VOLATILE_RE.search(path):
         ext = os.path.splitext(path)[1] or ".png"
         stable = tempfile.NamedTemporaryFile(
             suffix=ext, prefix="claude-ts-img-", delete=False,
@@ -93,40 +104,40 @@ def stabilize_image_path(path: str) -> str:
 
 
 def get_clipboard_image() -> str | None:
-    """Check macOS clipboard for image data and save to temp file. Returns path or None."""
-    try:
-        result = subprocess.run(
-            ["osascript", "-e", "clipboard info"],
-            capture_output=True, text=True, timeout=5,
-        )
-        if result.returncode != 0:
-            return None
-
-        info = result.stdout
-        has_png = "\u00abclass PNGf\u00bb" in info
-        has_tiff = "\u00abclass TIFF\u00bb" in info
-        if not has_png and not has_tiff:
-            return None
+    """Check macOS clipboard for image data and save to temp file. Returns path or None.
 
+    Probing and saving happen in one osascript run: PNG is tried first,
+    then TIFF, and the script prints NONE when the clipboard holds neither.
+    """
+    try:
         tmp = tempfile.NamedTemporaryFile(
             suffix=".png", prefix="claude-ts-img-", delete=False,
         )
         tmp_path = tmp.name
         tmp.close()
 
-        fmt = "\u00abclass PNGf\u00bb" if has_png else "\u00abclass TIFF\u00bb"
-        save_result = subprocess.run(
-            [
-                "osascript",
-                "-e", f"set img_data to the clipboard as {fmt}",
-                "-e", f'set fp to open for access POSIX file "{tmp_path}" with write permission',
-                "-e", "write img_data to fp",
-                "-e", "close access fp",
-            ],
-            capture_output=True, text=True, timeout=10,
-        )
-
-        if save_result.returncode == 0 and os.path.getsize(tmp_path) > 0:
+        script = [
+            "try",
+            f"  set img_data to the clipboard as {_PNG_MARKER}",
+            "on error",
+            "  try",
+            f"    set img_data to the clipboard as {_TIFF_MARKER}",
+            "  on error",
+            '    return "NONE"',
+            "  end try",
+            "end try",
+            f'set fp to open for access POSIX file "{tmp_path}" with write permission',
+            "write img_data to fp",
+            "close access fp",
+            'return "OK"',
+        ]
+        args = ["osascript"]
+        for line in script:
+            args += ["-e", line]
+        result = subprocess.run(args, capture_output=True, text=True, timeout=10)
+
+        if (result.returncode == 0 and result.stdout.strip() == "OK"
+                and os.path.getsize(tmp_path) > 0):
             return tmp_path
 
         os.unlink(tmp_path)
@@ -137,15 +148,25 @@ def get_clipboard_image() -> str | None:
 
 
 def drain_stdin() -> list[str]:
-    """Read remaining buffered lines from stdin (catches multi-line paste)."""
-    lines = []
+    """Read remaining buffered lines from stdin (catches multi-line paste).
+
+    Reads raw chunks from the fd (select-gated, so os.read never blocks)
+    and splits them once, instead of one readline() per pasted line.
+    """
+    chunks: list[bytes] = []
     try:
-        while select.select([sys.stdin], [], [], 0.05)[0]:
-            line = sys.stdin.readline()
-            if line:
-                lines.append(line.rstrip("\n"))
-            else:
+        fd = sys.stdin.fileno()
+        while select.select([fd], [], [], 0.05)[0]:
+            chunk = os.read(fd, 65536)
+            if not chunk:
                 break
+            chunks.append(chunk)
     except (OSError, ValueError):
         pass
+    if not chunks:
+        return []
+    data = b"".join(chunks).decode(sys.stdin.encoding or "utf-8", "replace")
+    lines = data.split("\n")
+    if lines[-1] == "":
+        lines.pop()  # trailing newline, not an empty line
     return lines
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 import select
+import shutil
 import signal
 import subprocess
 import sys
@@ -15,12 +16,23 @@ from claude_ts.state import config, SessionState, clean_env, list_session_record
 from claude_ts.tokens import fmt_tokens
 from claude_ts.ui import C, dim, error, success, render_markdown, SpinnerContext
 from claude_ts.clipboard import get_clipboard_image
-from claude_ts.ollama import _ollama_available, _ollama_list_models
 from claude_ts.executor import execute_streaming, process_image_turn
 from claude_ts.translation import translate
 from claude_ts.menus import interactive_tool_selector
 
 
+# Clipboard writer, resolved once at import (macOS → Wayland → X11)
+def _find_clipboard_cmd() -> list[str] | None:
+    for cmd in (["pbcopy"], ["wl-copy"], ["xclip", "-selection", "clipboard"]):
+        path = shutil.which(cmd[0])
+        if path:
+            return [path, *cmd[1:]]
+    return None
+
+
+_CLIPBOARD_CMD = _find_clipboard_cmd()
+
+
 def _run_cancellable(cmd: list[str], timeout: int = 300,
                      spinner_msg: str = ""
                      ) -> tuple[str, str, int] | None:
@@ -30,6 +42,7 @@ def _run_cancellable(cmd: list[str], timeout: int = 300,
     """
     done = threading.Event()
     cancelled = threading.Event()
+    finished = threading.Event()  # set on either completion or cancel
     result_box: dict = {}
 
     def _run():
@@ -47,6 +60,7 @@ def _run_cancellable(cmd: list[str], timeout: int = 300,
             result_box["error"] = str(e)
         finally:
             done.set()
+            finished.set()
 
     # 터미널을 non-canonical 모드로 (Ctrl+C/ESC 직접 감지)
     fd = sys.stdin.fileno()
@@ -72,6 +86,7 @@ def _run_cancellable(cmd: list[str], timeout: int = 300,
                     continue
                 if 3 in data or 27 in data:
                     cancelled.set()
+                    finished.set()
                     return
             except OSError:
                 return
@@ -89,13 +104,9 @@ def _run_cancellable(cmd: list[str], timeout: int = 300,
         time.sleep(0.1)
     proc = result_box.get("proc")
 
-    deadline = time.time() + timeout
     try:
         with SpinnerContext(spinner_msg or _s("msg_running", "Running... (Ctrl+C/ESC to cancel)")):
-            while not done.is_set():
-                if cancelled.is_set() or time.time() > deadline:
-                    break
-                done.wait(0.3)
+            finished.wait(timeout=timeout)
     finally:
         if terminal_modified:
             termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
@@ -220,18 +231,19 @@ def cmd_clear(state: SessionState, args: str) -> bool:
 def cmd_copy(state: SessionState, args: str) -> bool:
     if not state.last_assistant_response:
         error(_s("err_no_copy_content", "No response to copy."))
+    elif _CLIPBOARD_CMD is None:
+        error(_s("err_clipboard_tool_not_found", "No clipboard tool found (pbcopy, wl-copy or xclip)"))
     else:
         try:
             subprocess.run(
-                ["pbcopy"],
-                input=state.last_assistant_response,
-                text=True,
+                _CLIPBOARD_CMD,
+                input=state.last_assistant_response.encode("utf-8"),
                 timeout=5,
             )
             preview = state.last_assistant_response[:60].replace("\n", " ")
             success(f"{_s('msg_clipboard_copied', 'Copied to clipboard')}: \"{preview}...\"")
         except FileNotFoundError:
-            error(_s("err_pbcopy_not_found", "pbcopy not found (macOS only)"))
+            error(_s("err_clipboard_tool_not_found", "No clipboard tool found (pbcopy, wl-copy or xclip)"))
         except subprocess.TimeoutExpired:
             error(_s("err_clipboard_timeout", "Clipboard copy timed out"))
     print()
@@ -322,8 +334,9 @@ def cmd_doctor(state: SessionState, args: str) -> bool:
         pass
 
     # Ollama status
+    from claude_ts.ollama import _ollama_available, _ollama_list_models
     if _ollama_available():
-        models = _ollama_list_models()
+        models = _ollama_list_models()  # count only; a list up to _MODEL_TTL old is fine
         print(f"  {C.GREEN}✓{C.RESET} {_s('msg_ollama_installed', 'Ollama installed — models')} {len(models)}")
     else:
         print(f"  {C.DIM}– {_s('msg_ollama_not_installed', 'Ollama not installed')}{C.RESET}")
@@ -465,12 +478,13 @@ def cmd_model(state: SessionState, args: str) -> bool:
 
 
 def cmd_ollama(state: SessionState, args: str) -> bool:
+    from claude_ts.ollama import _ollama_available, _ollama_list_models
     current_marker = f"← {_s('label_current', 'current')}"
     options: list[tuple[str, str]] = [
         ("claude", f"claude (haiku) {current_marker if config.translate_backend == 'claude' else ''}"),
     ]
     if _ollama_available():
-        models = _ollama_list_models()
+        models = _ollama_list_models(refresh=True)
         if models:
             for m in models:
                 current = (
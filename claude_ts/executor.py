@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import os
-import queue
+import re
 import select
 import signal
 import subprocess
@@ -11,17 +11,98 @@ import sys
 import termios
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
 
-from claude_ts.state import config, SessionState, MAX_CONTEXT_TURNS, clean_env, save_session_record, _s
+from claude_ts.state import config, SessionState, clean_env, save_session_record, _s
 from claude_ts.stream_parser import StreamParser
 from claude_ts.ui import C, dim, error, dbg, dbg_block, SpinnerContext, render_markdown
-from claude_ts.translation import contains_target_language, translate
+from claude_ts.translation import contains_target_language, translate, translate_deferred
 
+# ESC, plus the CSI sequence it starts (arrow keys etc.) if any — a CSI
+# cut off at buffer end included. A one-byte match is a bare ESC.
+_ESC_RE = re.compile(rb"\x1b(?:\[[^\x40-\x7e]*[\x40-\x7e]?)?")
+_KR_RE = re.compile(r"[\uAC00-\uD7AF]+")
+_ALPHA_RE = re.compile(r"[^\W\d_]+")  # letters (\w minus digits and underscore)
 
-def execute_streaming(prompt: str, state: SessionState) -> str | None:
+
+def _korean_counts(text: str) -> tuple[int, int]:
+    """Count Hangul syllables and letters in text (letters at least 1).
+
+    Runs are matched rather than single characters. Text with no Hangul
+    at all — the usual English answer — returns (0, 1) after one search,
+    since its ratio is 0 whatever the letter count.
+    """
+    if _KR_RE.search(text) is None:
+        return 0, 1
+    korean = sum(map(len, _KR_RE.findall(text)))
+    return korean, sum(map(len, _ALPHA_RE.findall(text))) or 1
+
+
+# ── Result translation prefetch ──
+# The final answer arrives in the result event, before claude has exited and
+# the turn's footer and session record are written; en→kr starts right then.
+# The worker never touches the terminal: failures are reported when the
+# result is consumed on the main thread.
+
+_translate_pool = ThreadPoolExecutor(max_workers=1)
+
+
+class _Prefetch:
+    """A background en→kr translation of one answer."""
+
+    __slots__ = ("future", "cancel")
+
+    def __init__(self, text: str):
+        self.cancel = threading.Event()
+        self.future: Future = _translate_pool.submit(
+            translate_deferred, text, "en2kr", None, self.cancel)
+
+    def result(self) -> str:
+        translated, report = self.future.result()
+        if report is not None:
+            report()
+        return translated
+
+    def drop(self):
+        """Abandon the translation, killing its claude call if running."""
+        self.cancel.set()
+        self.future.cancel()
+
+
+def _prefetch_en2kr(text: str, prefetched: dict[str, _Prefetch]):
+    """on_result callback: start translating the answer in the background."""
+    korean_chars, total_alpha = _korean_counts(text)
+    if text.strip() and korean_chars / total_alpha <= 0.3:
+        prefetched[text] = _Prefetch(text)
+
+
+def _translate_result(text: str, prefetched: dict[str, _Prefetch]) -> str:
+    """en→kr translation of text, reusing a prefetched one when available."""
+    prefetch = prefetched.pop(text, None)
+    return prefetch.result() if prefetch is not None else translate(text, "en2kr")
+
+
+def _drop_prefetched(prefetched: dict[str, _Prefetch]):
+    """Abandon every prefetch the turn did not consume (failure or interrupt)."""
+    for prefetch in prefetched.values():
+        prefetch.drop()
+    prefetched.clear()
+
+
+def shutdown_prefetch():
+    """Stop the prefetch pool without waiting on a translation (called on exit)."""
+    _translate_pool.shutdown(wait=False, cancel_futures=True)
+
+
+def execute_streaming(
+    prompt: str, state: SessionState,
+    on_result: Callable[[str], None] | None = None,
+) -> str | None:
     """
     Run Claude Code with --output-format stream-json.
     Shows tool use in real-time. Updates state.turn_count.
+    on_result, if given, receives the final text as soon as it is streamed.
     Returns final_text or None on failure.
     """
     cmd = [
@@ -56,6 +137,9 @@ def execute_streaming(prompt: str, state: SessionState) -> str | None:
 
     dbg(f"CMD: claude -p --output-format stream-json ... '{prompt[:60]}...'")
 
+    # stderr already drained from a process that failed at start-up; the
+    # failure report below reads the pipe again and would find it empty
+    early_stderr = ""
     try:
         process = subprocess.Popen(
             cmd,
@@ -71,15 +155,25 @@ def execute_streaming(prompt: str, state: SessionState) -> str | None:
         time.sleep(0.15)
         if process.poll() is not None and process.returncode != 0:
             stderr_peek = process.stderr.read()
-            if "already in use" in stderr_peek:
+            if "already in use" not in stderr_peek:
+                early_stderr = stderr_peek
+            else:
                 dbg("Session ID in use — waiting for previous process to exit...")
                 dim(f"  {_s('msg_session_busy', 'Waiting for previous session to finish...')}")
                 # Clean up the failed process pipes
                 process.stdout.close()
                 process.stderr.close()
-                # Wait up to 5 seconds for the lock to release
-                for _ in range(10):
-                    time.sleep(0.5)
+                # Wait up to 5 seconds for the lock to release. Every retry
+                # is a full claude start-up, so back off between attempts.
+                delay = 0.1
+                waited = 0.0
+                while True:
+                    if waited + delay > 5:
+                        error(_s("err_session_locked", "Session is locked by another process. Try /reset."))
+                        return None
+                    time.sleep(delay)
+                    waited += delay
+                    delay = min(delay * 2, 1.0)
                     process = subprocess.Popen(
                         cmd,
                         stdout=subprocess.PIPE,
@@ -89,23 +183,23 @@ def execute_streaming(prompt: str, state: SessionState) -> str | None:
                         bufsize=1,
                         start_new_session=True,
                     )
-                    time.sleep(0.15)
-                    if process.poll() is None:
+                    try:
+                        process.wait(timeout=0.15)
+                    except subprocess.TimeoutExpired:
                         break  # successfully started
                     retry_err = process.stderr.read()
+                    if "already in use" not in retry_err:
+                        early_stderr = retry_err
+                        break  # different error, let it fall through
                     # Clean up failed retry process pipes
                     process.stdout.close()
                     process.stderr.close()
-                    if "already in use" not in retry_err:
-                        break  # different error, let it fall through
-                else:
-                    error(_s("err_session_locked", "Session is locked by another process. Try /reset."))
-                    return None
     except FileNotFoundError:
         error(_s("claude_not_found", "claude command not found."))
         return None
 
     parser = StreamParser()
+    parser.on_result = on_result
     parser.start_waiting_spinner()
 
     # Put stdin into raw-ish mode so we can detect ESC / Ctrl+C keypresses
@@ -141,100 +235,90 @@ def execute_streaming(prompt: str, state: SessionState) -> str | None:
             except subprocess.TimeoutExpired:
                 pass
 
-    # Key monitor thread: detect ESC or Ctrl+C and cancel execution
-    def _key_monitor():
-        while not cancelled.is_set():
-            try:
-                r, _, _ = select.select([fd], [], [], 0.15)
-                if not r:
-                    continue
-                data = os.read(fd, 64)
-                if not data:
-                    continue
-                if 3 in data:  # Ctrl+C
-                    cancelled.set()
-                    _kill_process()
-                    return
-                # Check for bare ESC (not part of escape sequence like arrow keys)
-                i = 0
-                while i < len(data):
-                    if data[i] == 0x1B:
-                        # ESC followed by '[' = CSI sequence (arrow keys etc.)
-                        if i + 1 < len(data) and data[i + 1] == ord('['):
-                            i += 2
-                            while i < len(data) and not (0x40 <= data[i] <= 0x7E):
-                                i += 1
-                            i += 1
-                            continue
-                        # ESC at end of buffer — wait briefly for more bytes
-                        if i + 1 >= len(data):
-                            r2, _, _ = select.select([fd], [], [], 0.05)
-                            if r2:
-                                extra = os.read(fd, 64)
-                                if extra and extra[0] == ord('['):
-                                    i += 1
-                                    continue
-                        # Bare ESC — cancel
-                        cancelled.set()
-                        _kill_process()
-                        return
-                    i += 1
-            except OSError:
-                return
-
-    if terminal_modified:
-        key_thread = threading.Thread(target=_key_monitor, daemon=True)
-        key_thread.start()
+    # Key check: detect ESC or Ctrl+C in bytes read from stdin
+    def _is_cancel_key(data: bytes) -> bool:
+        if 3 in data:  # Ctrl+C
+            return True
+        for m in _ESC_RE.finditer(data):
+            if m.end() - m.start() > 1:
+                continue  # CSI sequence, not a bare ESC
+            if m.end() == len(data):
+                # ESC at end of buffer — wait briefly for more bytes
+                r2, _, _ = select.select([fd], [], [], 0.05)
+                if r2:
+                    extra = os.read(fd, 64)
+                    if extra and extra[0] == 0x5B:  # '[' — start of a CSI sequence
+                        return False
+            return True
+        return False
 
     # Watchdog: detect stalls when no stdout data arrives for too long.
+    # Checked by the select loop below, whose timeout runs to the next deadline.
     STALL_WARN_SECS = 30
+    STALL_WARN_EVERY = 10  # warning text counts idle time in steps of this
     STALL_KILL_SECS = 180
     last_data_time = time.monotonic()
-    watchdog_stop = threading.Event()
+    next_warn = last_data_time + STALL_WARN_SECS
 
-    def _watchdog():
-        while not watchdog_stop.wait(5):
-            idle = time.monotonic() - last_data_time
-            if idle >= STALL_KILL_SECS:
+    # ── Multiplex claude's stdout and keypresses on one select() ──
+    # stdout is read as raw chunks from its fd and split into lines here;
+    # the text-mode process.stdout wrapper is never read from.
+    out_fd = process.stdout.fileno()
+    os.set_blocking(out_fd, False)
+    watch_fds = [out_fd, fd] if terminal_modified else [out_fd]
+    pending = bytearray()  # bytes after the last complete line
+
+    try:
+        while not cancelled.is_set():
+            now = time.monotonic()
+            kill_at = last_data_time + STALL_KILL_SECS
+            if now >= kill_at:
                 parser._set_status(f"⚠️ {_s('msg_no_response_auto', 'No response — auto-cancelling...')}")
                 cancelled.set()
                 _kill_process()
-                return
-            elif idle >= STALL_WARN_SECS:
-                secs = int(idle)
-                parser._set_status(f"⚠️ {secs}s {_s('msg_no_response_esc', 'no response (ESC to cancel)')}")
-
-    watchdog_thread = threading.Thread(target=_watchdog, daemon=True)
-    watchdog_thread.start()
-
-    # ── Read stdout in background thread, drain via queue ──
-    line_queue: queue.Queue[str | None] = queue.Queue()
-
-    def _stdout_reader():
-        try:
-            for line in process.stdout:
-                line_queue.put(line)
-        except (OSError, ValueError):
-            pass
-        line_queue.put(None)  # sentinel: EOF
-
-    reader_thread = threading.Thread(target=_stdout_reader, daemon=True)
-    reader_thread.start()
-
-    try:
-        while True:
+                break
+            if now >= next_warn:
+                secs = int(now - last_data_time) // STALL_WARN_EVERY * STALL_WARN_EVERY
+                warning = f"⚠️ {secs}s {_s('msg_no_response_esc', 'no response (ESC to cancel)')}"
+                if warning != parser._status_base:
+                    parser._set_status(warning)
+                next_warn = last_data_time + secs + STALL_WARN_EVERY
             try:
-                line = line_queue.get(timeout=0.2)
-            except queue.Empty:
-                if cancelled.is_set():
+                ready, _, _ = select.select(watch_fds, [], [], min(next_warn, kill_at) - now)
+            except InterruptedError:
+                continue
+            if fd in ready:
+                try:
+                    keys = os.read(fd, 64)
+                except OSError:
+                    keys = b""
+                if keys and _is_cancel_key(keys):
+                    cancelled.set()
+                    _kill_process()
                     break
+            if out_fd not in ready:
                 continue
-            if line is None:  # EOF
-                break
-            if cancelled.is_set():
+            try:
+                chunk = os.read(out_fd, 65536)
+            except BlockingIOError:
+                continue
+            except OSError:
+                chunk = b""
+            if not chunk:  # EOF
+                if pending.strip():
+                    parser.feed_line(pending.decode("utf-8", "replace"))
                 break
             last_data_time = time.monotonic()
-            parser.feed_line(line)
+            next_warn = last_data_time + STALL_WARN_SECS
+            pending += chunk
+            cut = pending.rfind(b"\n")
+            if cut < 0:
+                continue  # no complete line yet
+            # One decode and one split for all complete lines in the buffer
+            lines = pending[:cut].decode("utf-8", "replace").split("\n")
+            del pending[:cut + 1]
+            for line in lines:
+                parser.feed_line(line)
 
         if not cancelled.is_set():
             process.wait()
@@ -261,7 +345,7 @@ def execute_streaming(prompt: str, state: SessionState) -> str | None:
             save_session_record(state)
             return parser.get_final_text()
         else:
-            stderr_out = process.stderr.read()
+            stderr_out = early_stderr or process.stderr.read()
             error(f"{_s('err_claude_exec_failed', 'Claude Code execution failed')} (exit: {process.returncode})")
             if stderr_out:
                 print(f"{C.DIM}{stderr_out.strip()}{C.RESET}", file=sys.stderr)
@@ -275,13 +359,15 @@ def execute_streaming(prompt: str, state: SessionState) -> str | None:
 
     finally:
         # Always clean up everything
+        killed = cancelled.is_set()  # cancel paths have already killed it
         cancelled.set()
-        watchdog_stop.set()
         # Ensure process is dead and session lock is released
         if process.poll() is None:
             _kill_process()
-        # Wait a moment for Claude Code to release the session lock file
-        if cancelled.is_set():
+            killed = True
+        # After a kill, wait a moment for Claude Code to release the session
+        # lock file; a process that exited by itself has already released it
+        if killed:
             time.sleep(0.3)
         parser.stop_waiting_spinner()
         parser._stop_spin_timer()
@@ -317,41 +403,43 @@ def process_image_turn(
     if config.allowed_tools and "Read" not in config.allowed_tools:
         config.allowed_tools += " Read"
 
-    en_output = execute_streaming(full_prompt, state)
-
-    config.allowed_tools = original_tools
-
-    if en_output and en_output.strip():
-        korean_chars = sum(1 for ch in en_output if '\uAC00' <= ch <= '\uD7AF')
-        total_alpha = sum(1 for ch in en_output if ch.isalpha()) or 1
-        if korean_chars / total_alpha > 0.3:
-            kr_output = en_output
-        else:
-            with SpinnerContext(_s("msg_translating_result", "Translating result...")):
-                kr_output = translate(en_output, "en2kr")
-        print()
-        render_markdown(kr_output)
+    prefetched: dict[str, _Prefetch] = {}
+    try:
+        en_output = execute_streaming(
+            full_prompt, state, lambda text: _prefetch_en2kr(text, prefetched))
+
+        config.allowed_tools = original_tools
+
+        if en_output and en_output.strip():
+            korean_chars, total_alpha = _korean_counts(en_output)
+            if korean_chars / total_alpha > 0.3:
+                kr_output = en_output
+            else:
+                with SpinnerContext(_s("msg_translating_result", "Translating result...")):
+                    kr_output = _translate_result(en_output, prefetched)
+            print()
+            render_markdown(kr_output)
+            print()
+            # Save context
+            state.conversation_context.append({
+                "user": full_prompt[:200],
+                "assistant": en_output[:300],
+            })
+            # Save full history
+            state.last_assistant_response = kr_output
+            ts = time.strftime("%Y-%m-%d %H:%M:%S")
+            state.conversation_history.append({
+                "role": "user", "text": f"[{_s('label_image', 'Image')}: {img_path}] {question}", "ts": ts,
+            })
+            state.conversation_history.append({
+                "role": "assistant", "text": kr_output, "ts": ts,
+            })
+            return
+
+        error(_s("err_no_response", "No response received."))
         print()
-        # Save context
-        state.conversation_context.append({
-            "user": full_prompt[:200],
-            "assistant": en_output[:300],
-        })
-        while len(state.conversation_context) > MAX_CONTEXT_TURNS:
-            state.conversation_context.pop(0)
-        # Save full history
-        state.last_assistant_response = kr_output
-        ts = time.strftime("%Y-%m-%d %H:%M:%S")
-        state.conversation_history.append({
-            "role": "user", "text": f"[{_s('label_image', 'Image')}: {img_path}] {question}", "ts": ts,
-        })
-        state.conversation_history.append({
-            "role": "assistant", "text": kr_output, "ts": ts,
-        })
-        return
-
-    error(_s("err_no_response", "No response received."))
-    print()
+    finally:
+        _drop_prefetched(prefetched)
 
 
 def process_turn(user_input: str, state: SessionState) -> None:
@@ -380,53 +468,54 @@ def process_turn(user_input: str, state: SessionState) -> None:
 
     # ── Step 2: Execute Claude Code (streaming) ──
     tools_before = state.stats.tool_count
-    en_output = execute_streaming(en_input, state)
+    prefetched: dict[str, _Prefetch] = {}
+    try:
+        en_output = execute_streaming(
+            en_input, state, lambda text: _prefetch_en2kr(text, prefetched))
+
+        if en_output is None:
+            return
+
+        dbg_block("EN OUTPUT", en_output)
+
+        tools_this_turn = state.stats.tool_count - tools_before
+        if not en_output.strip():
+            # Not an error if tools ran — Claude Code did the work via tool calls
+            # (e.g. file edits, bash commands) without a text summary.
+            if tools_this_turn > 0:
+                dim(_s("msg_tool_only", "Task completed via tool calls (no text response)"))
+                print()
+            else:
+                error(_s("err_empty_response", "Empty response received"))
+            return
+
+        # ── Step 3: English → Korean ──
+        # Guard: if Claude Code responded in Korean despite the system prompt,
+        # skip translation to avoid the translator saying "already Korean".
+        korean_chars, total_alpha = _korean_counts(en_output)
+        if korean_chars / total_alpha > 0.3:
+            dbg("[skip en2kr] 응답이 이미 한국어 (비율: "
+                f"{korean_chars}/{total_alpha} = {korean_chars/total_alpha:.0%})")
+            kr_output = en_output
+        else:
+            with SpinnerContext(_s("msg_translating_result", "Translating result...")):
+                kr_output = _translate_result(en_output, prefetched)
 
-    if en_output is None:
-        return
+        # ── Step 4: Display (rich markdown) ──
+        print()
+        render_markdown(kr_output)
+        print()
 
-    dbg_block("EN OUTPUT", en_output)
+        # ── Step 5: Save context for future translations (oldest turn drops off) ──
+        state.conversation_context.append({
+            "user": en_input,
+            "assistant": en_output[:300],
+        })
 
-    tools_this_turn = state.stats.tool_count - tools_before
-    if not en_output.strip():
-        # Not an error if tools ran — Claude Code did the work via tool calls
-        # (e.g. file edits, bash commands) without a text summary.
-        if tools_this_turn > 0:
-            dim(_s("msg_tool_only", "Task completed via tool calls (no text response)"))
-            print()
-        else:
-            error(_s("err_empty_response", "Empty response received"))
-        return
-
-    # ── Step 3: English → Korean ──
-    # Guard: if Claude Code responded in Korean despite the system prompt,
-    # skip translation to avoid the translator saying "already Korean".
-    korean_chars = sum(1 for ch in en_output if '\uAC00' <= ch <= '\uD7AF')
-    total_alpha = sum(1 for ch in en_output if ch.isalpha()) or 1
-    if korean_chars / total_alpha > 0.3:
-        dbg("[skip en2kr] 응답이 이미 한국어 (비율: "
-            f"{korean_chars}/{total_alpha} = {korean_chars/total_alpha:.0%})")
-        kr_output = en_output
-    else:
-        with SpinnerContext(_s("msg_translating_result", "Translating result...")):
-            kr_output = translate(en_output, "en2kr")
-
-    # ── Step 4: Display (rich markdown) ──
-    print()
-    render_markdown(kr_output)
-    print()
-
-    # ── Step 5: Save context for future translations ──
-    state.conversation_context.append({
-        "user": en_input,
-        "assistant": en_output[:300],
-    })
-    # Keep only recent turns
-    while len(state.conversation_context) > MAX_CONTEXT_TURNS:
-        state.conversation_context.pop(0)
-
-    # ── Step 6: Save full history for /export and /copy ──
-    state.last_assistant_response = kr_output
-    ts = time.strftime("%Y-%m-%d %H:%M:%S")
-    state.conversation_history.append({"role": "user", "text": user_input, "ts": ts})
-    state.conversation_history.append({"role": "assistant", "text": kr_output, "ts": ts})
+        # ── Step 6: Save full history for /export and /copy ──
+        state.last_assistant_response = kr_output
+        ts = time.strftime("%Y-%m-%d %H:%M:%S")
+        state.conversation_history.append({"role": "user", "text": user_input, "ts": ts})
+        state.conversation_history.append({"role": "assistant", "text": kr_output, "ts": ts})
+    finally:
+        _drop_prefetched(prefetched)
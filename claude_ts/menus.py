@@ -12,6 +12,13 @@ from claude_ts.ui import C
 from claude_ts.terminal import _read_esc_seq
 from claude_ts.state import _s
 
+# Row templates, formatted with % per redraw
+_CMD_ROW_SEL = f"  {C.CYAN}›{C.RESET} {C.BOLD}/%-10s{C.RESET} %s"
+_CMD_ROW = f"    {C.DIM}/%-10s %s{C.RESET}"
+_TOOL_ROW = f"  %s [%s] %-6s  {C.DIM}%s{C.RESET}\r\n"
+_POINTER = f"{C.CYAN}›{C.RESET}"
+_CHECK = f"{C.GREEN}✓{C.RESET}"
+
 
 def get_slash_commands() -> list[tuple[str, str]]:
     """Return slash commands with localized descriptions."""
@@ -40,8 +47,11 @@ def get_slash_commands() -> list[tuple[str, str]]:
     ]
 
 
-def _filter_commands(q: str) -> list[tuple[str, str]]:
-    commands = get_slash_commands()
+def _filter_commands(
+    q: str, commands: list[tuple[str, str]] | None = None,
+) -> list[tuple[str, str]]:
+    if commands is None:
+        commands = get_slash_commands()
     if not q:
         return list(commands)
     ql = q.lower()
@@ -58,64 +68,78 @@ def slash_menu_raw(fd: int, prompt_str: str) -> str | None:
     """
     query = ""
     cursor_idx = 0
-    filtered = list(get_slash_commands())
+    commands = get_slash_commands()  # localized once per menu session
+    filtered = list(commands)
     rendered_h = 0  # lines rendered below input line
+    no_match = _s('label_no_match', 'No matching command')
+    nav_hint = _s('label_nav_hint', '↑↓ Navigate · Enter Select · Esc Cancel')
 
     def _menu_h() -> int:
         return max(len(filtered), 1) + 1  # items (or 1 empty msg) + help line
 
     def _draw(first: bool = False):
+        """Redraw the input line and menu, emitted as a single write."""
         nonlocal rendered_h
         h = _menu_h()
+        out: list[str] = []
 
         if first:
             # Create scroll space so menu is visible at bottom of terminal
-            sys.stdout.write(("\r\n") * h)
-            sys.stdout.write(f"\033[{h}A")
+            out.append(("\r\n") * h)
+            out.append(f"\033[{h}A")
             # Now at input line, col 0
         else:
             # Move up from end of menu to input line
             if rendered_h > 0:
-                sys.stdout.write(f"\033[{rendered_h}A")
-            sys.stdout.write("\r")
+                out.append(f"\033[{rendered_h}A")
+            out.append("\r")
 
         # Rewrite input line
-        sys.stdout.write(f"{prompt_str}/{query}\033[K")
+        out.append(f"{prompt_str}/{query}\033[K")
 
         # Move to first menu line and clear everything below
-        sys.stdout.write("\n\033[J")
+        out.append("\n\033[J")
 
         # Render menu items
         for i, (cmd, desc) in enumerate(filtered):
             if i > 0:
-                sys.stdout.write("\r\n")
-            if i == cursor_idx:
-                sys.stdout.write(
-                    f"  {C.CYAN}›{C.RESET} {C.BOLD}/{cmd:<10}{C.RESET} {desc}"
-                )
-            else:
-                sys.stdout.write(
-                    f"    {C.DIM}/{cmd:<10} {desc}{C.RESET}"
-                )
+                out.append("\r\n")
+            out.append((_CMD_ROW_SEL if i == cursor_idx else _CMD_ROW) % (cmd, desc))
 
         if not filtered:
-            sys.stdout.write(f"    {C.DIM}({_s('label_no_match', 'No matching command')}){C.RESET}")
+            out.append(f"    {C.DIM}({no_match}){C.RESET}")
 
-        sys.stdout.write(
-            f"\r\n  {C.DIM}{_s('label_nav_hint', '↑↓ Navigate · Enter Select · Esc Cancel')}{C.RESET}"
+        out.append(
+            f"\r\n  {C.DIM}{nav_hint}{C.RESET}"
         )
+        sys.stdout.write("".join(out))
         sys.stdout.flush()
         rendered_h = h
 
     def _erase():
         """Remove menu, leave cursor at col 0 of (cleared) input line."""
         nonlocal rendered_h
-        if rendered_h > 0:
-            sys.stdout.write(f"\033[{rendered_h}A")
-        sys.stdout.write("\r\033[J")
+        up = f"\033[{rendered_h}A" if rendered_h > 0 else ""
+        sys.stdout.write(f"{up}\r\033[J")
         sys.stdout.flush()
         rendered_h = 0
 
+    def _move_cursor(old: int):
+        """Arrow-key fast path: repaint only the rows for old and cursor_idx.
+
+        The cursor sits on the help line below the last item, so row i is
+        len(filtered) - i lines up. Row 0 shares its start column with the
+        end of the input line, so moves touching it go through _draw().
+        """
+        n = len(filtered)
+        out: list[str] = []
+        for i in (old, cursor_idx):
+            up = n - i
+            row = (_CMD_ROW_SEL if i == cursor_idx else _CMD_ROW) % filtered[i]
+            out.append(f"\033[{up}A\r{row}\033[K\033[{up}B")
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+
     # Initial render (shows "/" on input line + menu below)
     _draw(first=True)
 
@@ -135,11 +159,15 @@ def slash_menu_raw(fd: int, prompt_str: str) -> str | None:
                     sys.stdout.flush()
                     return None
                 if len(seq) >= 3 and seq[1:2] == b"[":
+                    old_idx = cursor_idx
                     if seq[2:3] == b"A" and filtered:   # Up
                         cursor_idx = (cursor_idx - 1) % len(filtered)
                     elif seq[2:3] == b"B" and filtered: # Down
                         cursor_idx = (cursor_idx + 1) % len(filtered)
-                    _draw()
+                    if cursor_idx != old_idx and old_idx and cursor_idx:
+                        _move_cursor(old_idx)
+                    elif cursor_idx != old_idx or not filtered:
+                        _draw()
                 continue
 
             if byte == 3:  # Ctrl-C → cancel
@@ -159,7 +187,7 @@ def slash_menu_raw(fd: int, prompt_str: str) -> str | None:
             if byte in (127, 8):  # Backspace
                 if query:
                     query = query[:-1]
-                    filtered = _filter_commands(query)
+                    filtered = _filter_commands(query, commands)
                     cursor_idx = min(cursor_idx, max(len(filtered) - 1, 0))
                     _draw()
                 else:
@@ -175,7 +203,7 @@ def slash_menu_raw(fd: int, prompt_str: str) -> str | None:
 
             if 0x20 <= byte < 0x7F:  # Printable ASCII → filter
                 query += chr(byte)
-                filtered = _filter_commands(query)
+                filtered = _filter_commands(query, commands)
                 cursor_idx = 0
                 _draw()
                 continue
@@ -226,20 +254,25 @@ def interactive_tool_selector() -> str:
     done_idx = len(tools)          # index of [완료] button
     total_items = len(tools) + 1   # tools + done button
     total_lines = total_items + 2  # items + blank + help line
+    done_label = _s('label_done', 'Done')
+    selected_label = _s('label_selected_count', ' selected')
+    nav_hint = _s('label_nav_hint_short', '↑↓ Navigate · Enter Select/Done')
 
     def render(first: bool = False):
-        if not first:
-            sys.stdout.write(f"\033[{total_lines}A\033[J")
+        """Draw the selector. Lines end in CRLF: redraws happen in raw mode."""
+        out = [] if first else [f"\033[{total_lines}A\033[J"]
         for i, tool in enumerate(tools):
-            check = f"{C.GREEN}✓{C.RESET}" if selected[i] else " "
-            ptr = f"{C.CYAN}›{C.RESET}" if i == cursor else " "
-            print(f"  {ptr} [{check}] {tool:<6}  {C.DIM}{descs[i]}{C.RESET}", flush=True)
+            check = _CHECK if selected[i] else " "
+            ptr = _POINTER if i == cursor else " "
+            out.append(_TOOL_ROW % (ptr, check, tool, descs[i]))
         # Done button
-        ptr = f"{C.CYAN}›{C.RESET}" if cursor == done_idx else " "
+        ptr = _POINTER if cursor == done_idx else " "
         count = sum(selected)
-        print(f"  {ptr} {C.BOLD}[{_s('label_done', 'Done')}]{C.RESET} {C.DIM}({count}{_s('label_selected_count', ' selected')}){C.RESET}", flush=True)
-        print(flush=True)
-        print(f"  {C.DIM}{_s('label_nav_hint_short', '↑↓ Navigate · Enter Select/Done')}{C.RESET}", flush=True)
+        out.append(f"  {ptr} {C.BOLD}[{done_label}]{C.RESET} {C.DIM}({count}{selected_label}){C.RESET}\r\n")
+        out.append("\r\n")
+        out.append(f"  {C.DIM}{nav_hint}{C.RESET}\r\n")
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
 
     fd = sys.stdin.fileno()
     old = termios.tcgetattr(fd)
@@ -268,10 +301,7 @@ def interactive_tool_selector() -> str:
             else:
                 continue
 
-            # Temporarily restore terminal for rendering
-            termios.tcsetattr(fd, termios.TCSADRAIN, old)
             render()
-            tty.setraw(fd)
     except (EOFError, KeyboardInterrupt):
         pass
     finally:
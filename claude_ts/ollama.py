@@ -2,14 +2,76 @@
 
 from __future__ import annotations
 
+import http.client
 import json
 import shutil
+import socket
 import subprocess
-import urllib.error
-import urllib.request
+import threading
+import time
 
-from claude_ts.ui import error
-from claude_ts.state import _s
+from claude_ts.state import _s, _loads
+from claude_ts.ui import dim
+
+try:
+    import orjson
+
+    def _encode(obj) -> bytes:
+        try:
+            return orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            # lone surrogates in the prompt; json escapes them
+            return json.dumps(obj).encode("utf-8")
+except ImportError:
+    def _encode(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
+# One keep-alive connection to the local server, shared by every request
+_OLLAMA_HOST = ("localhost", 11434)
+_conn: http.client.HTTPConnection | None = None
+_conn_lock = threading.Lock()
+
+
+class OllamaHTTPError(Exception):
+    """The Ollama server answered with a non-200 status."""
+
+
+def _send(method: str, path: str, payload: bytes | None, timeout: float) -> bytes:
+    """One request over the shared connection; it is dropped on any failure."""
+    global _conn
+    if _conn is None:
+        _conn = http.client.HTTPConnection(*_OLLAMA_HOST, timeout=timeout)
+    else:
+        _conn.timeout = timeout
+        if _conn.sock is not None:
+            _conn.sock.settimeout(timeout)
+    headers = {"Content-Type": "application/json"} if payload is not None else {}
+    try:
+        _conn.request(method, path, body=payload, headers=headers)
+        resp = _conn.getresponse()
+        body = resp.read()
+    except BaseException:
+        _conn.close()
+        _conn = None
+        raise
+    if resp.status != 200:
+        raise OllamaHTTPError(f"HTTP {resp.status} {resp.reason}")
+    return body
+
+
+def _ollama_request(method: str, path: str, payload: bytes | None, timeout: float) -> bytes:
+    """Send a request to the local server and return the response body.
+
+    Raises OSError (socket.timeout on timeout), http.client.HTTPException
+    or OllamaHTTPError.
+    """
+    with _conn_lock:
+        try:
+            return _send(method, path, payload, timeout)
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            # The server closed the idle keep-alive socket — reconnect once
+            return _send(method, path, payload, timeout)
 
 
 def _ollama_available() -> bool:
@@ -17,15 +79,29 @@ def _ollama_available() -> bool:
     return shutil.which("ollama") is not None
 
 
-def _ollama_list_models() -> list[str]:
-    """Return list of locally available ollama model names."""
+_MODEL_TTL = 30.0  # seconds a model list is reused
+_model_cache: tuple[float, list[str]] | None = None  # (time.monotonic(), models)
+
+
+def _list_models_http() -> list[str] | None:
+    """Model names from the server's /api/tags, or None if it can't be reached."""
+    try:
+        body = _loads(_ollama_request("GET", "/api/tags", None, timeout=10))
+        return [m["name"] for m in body.get("models", [])]
+    except (OSError, http.client.HTTPException, OllamaHTTPError,
+            json.JSONDecodeError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def _list_models_cli() -> list[str] | None:
+    """Model names parsed from `ollama list`, or None if it fails."""
     try:
         result = subprocess.run(
             ["ollama", "list"],
             capture_output=True, text=True, timeout=10,
         )
         if result.returncode != 0:
-            return []
+            return None
         models = []
         for line in result.stdout.strip().splitlines()[1:]:  # skip header
             parts = line.split()
@@ -33,11 +109,40 @@ def _ollama_list_models() -> list[str]:
                 models.append(parts[0])
         return models
     except (FileNotFoundError, subprocess.TimeoutExpired):
-        return []
+        return None
+
+
+def _ollama_list_models(refresh: bool = False) -> list[str]:
+    """Return list of locally available ollama model names.
+
+    Asks the local server over HTTP, falling back to the ollama CLI.
+    Results are cached for _MODEL_TTL seconds; refresh=True skips the cache
+    (e.g. to pick up an `ollama pull`). If listing fails, the last known
+    list (if any) is returned with a notice that it may be out of date.
+    """
+    global _model_cache
+    now = time.monotonic()
+    if not refresh and _model_cache is not None and now - _model_cache[0] < _MODEL_TTL:
+        return list(_model_cache[1])
+    models = _list_models_http()
+    if models is None:
+        models = _list_models_cli()
+    if models is None:
+        if _model_cache is None:
+            return []
+        dim(_s("msg_ollama_models_stale", "Could not list Ollama models — showing the last known list"))
+        return list(_model_cache[1])
+    _model_cache = (now, models)
+    return list(models)
 
 
-def _ollama_generate(prompt: str, model: str, system: str | None = None) -> str | None:
-    """Call Ollama's /api/generate endpoint (non-streaming)."""
+def _ollama_generate(prompt: str, model: str,
+                     system: str | None = None) -> tuple[str | None, str | None]:
+    """Call Ollama's /api/generate endpoint (non-streaming).
+
+    Returns (response, None), or (None, error message) on failure. Nothing is
+    printed, so this is safe to call off the main thread.
+    """
     body: dict = {
         "model": model,
         "prompt": prompt,
@@ -45,25 +150,14 @@ def _ollama_generate(prompt: str, model: str, system: str | None = None) -> str
     }
     if system:
         body["system"] = system
-    payload = json.dumps(body).encode("utf-8")
-
-    req = urllib.request.Request(
-        "http://localhost:11434/api/generate",
-        data=payload,
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
+    payload = _encode(body)
 
     try:
-        with urllib.request.urlopen(req, timeout=120) as resp:
-            body = json.loads(resp.read().decode("utf-8"))
-            return body.get("response", "").strip() or None
-    except urllib.error.URLError as e:
-        error(f"{_s('err_ollama_connect', 'Ollama server connection failed')}: {e.reason}")
-        return None
+        body = _loads(_ollama_request("POST", "/api/generate", payload, timeout=120))
+        return body.get("response", "").strip() or None, None
     except json.JSONDecodeError:
-        error(_s("err_ollama_parse", "Ollama response parse failed"))
-        return None
-    except TimeoutError:
-        error(_s("err_ollama_timeout", "Ollama response timeout (120s)"))
-        return None
+        return None, _s("err_ollama_parse", "Ollama response parse failed")
+    except (TimeoutError, socket.timeout):
+        return None, _s("err_ollama_timeout", "Ollama response timeout (120s)")
+    except (OSError, http.client.HTTPException, OllamaHTTPError) as e:
+        return None, f"{_s('err_ollama_connect', 'Ollama server connection failed')}: {e}"
@@ -1,6 +1,10 @@
 """Slim REPL loop (~120 lines)."""
 
+from __future__ import annotations
+
+import functools
 import os
+import stat
 import sys
 import time
 
@@ -10,24 +14,82 @@ from claude_ts.clipboard import drain_stdin, detect_image_path, get_clipboard_im
 from claude_ts.terminal import read_input
 from claude_ts.menus import slash_menu_raw, interactive_command_menu, ask_permission_mode
 from claude_ts.commands import dispatch
-from claude_ts.executor import process_image_turn, process_turn
+from claude_ts.executor import process_image_turn, process_turn, shutdown_prefetch
+from claude_ts.translation import close_translation_worker, enable_translation_prespawn
+
+
+# ── Prompt strings ──
+# Keyed by language code, since _s follows config.language (/lang).
+
+@functools.lru_cache(maxsize=None)
+def _question_prompt(lang: str) -> str:
+    return f"  \001{C.DIM}\002{_s('prompt_question', 'Question (Enter=describe)')}: \001{C.RESET}\002"
+
+
+@functools.lru_cache(maxsize=None)
+def _confirm_prompt(lang: str) -> str:
+    return f"  \001{C.DIM}\002{_s('msg_send_confirm', 'Press Enter to send, n to cancel')}: \001{C.RESET}\002"
+
+
+@functools.lru_cache(maxsize=None)
+def _cancelled_msg(lang: str) -> str:
+    return f"  {C.DIM}{_s('msg_cancelled', 'Cancelled')}{C.RESET}"
+
+
+def _stat_file(path: str) -> os.stat_result | None:
+    """stat() a regular file in one syscall; None if it is gone or not a file."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st if stat.S_ISREG(st.st_mode) else None
+
+
+def _accept_image(path: str, state: SessionState) -> tuple[str, float] | None:
+    """Make a detected image path usable: (path, size in KB), or None if lost.
+
+    Volatile macOS temp paths are copied to a stable temp file first. If the
+    file is already gone, the clipboard image is used instead; when there is
+    none either, the error is reported here.
+    """
+    # Stabilize volatile macOS temp paths (screenshot preview drag)
+    stable_path = stabilize_image_path(path)
+    if stable_path != path:
+        state.track_temp_file(stable_path)
+    st = _stat_file(stable_path)
+    if st is None:
+        # File already gone — try clipboard image as fallback
+        dim(_s("msg_image_volatile", "Temp file gone, checking clipboard..."))
+        clip_img = get_clipboard_image()
+        if not clip_img:
+            error(_s("err_image_gone",
+                "Image file removed by macOS. Use Cmd+Shift+Ctrl+4 to copy screenshot to clipboard, then paste."))
+            print()
+            return None
+        state.track_temp_file(clip_img)
+        stable_path = clip_img
+        st = os.stat(stable_path)
+    return stable_path, st.st_size / 1024
 
 
 def repl():
     state = SessionState()
+    enable_translation_prespawn()
 
-    print(f"  {C.BOLD}━━━ {_s('label_banner_title', 'Claude Code')} ━━━{C.RESET}")
     if config.translate_backend == "ollama":
         translate_label = f"ollama:{config.ollama_model}"
     else:
         translate_label = config.translate_model
-    print(
+    # Each banner block goes out in a single write
+    sys.stdout.write(
+        f"  {C.BOLD}━━━ {_s('label_banner_title', 'Claude Code')} ━━━{C.RESET}\n"
         f"  {C.DIM}{_s('label_translate', 'Translate')}: {translate_label} | "
         f"{_s('label_task_model', 'Task')}: {config.main_model or 'default'} | "
-        f"{_s('label_streaming', 'Streaming: ON')}{C.RESET}"
+        f"{_s('label_streaming', 'Streaming: ON')}{C.RESET}\n"
+        f"  {C.DIM}{_s('label_session', 'Session')}: {state.session_uuid[:8]}...{C.RESET}\n"
+        "\n"
     )
-    print(f"  {C.DIM}{_s('label_session', 'Session')}: {state.session_uuid[:8]}...{C.RESET}")
-    print()
+    sys.stdout.flush()
 
     # Ask permission mode if not set via CLI flags
     if not config.allowed_tools and not config.dangerously_skip_permissions:
@@ -38,9 +100,12 @@ def repl():
         else f"{_s('label_perm_allowed', 'Allowed')}: {config.allowed_tools}" if config.allowed_tools
         else _s("label_perm_readonly", "Read-only")
     )
-    print(f"  {C.DIM}{_s('label_permission', 'Permission')}: {perm_label}{C.RESET}")
-    print(f"  {C.DIM}{_s('label_slash_hint', 'Type / to see command list')}{C.RESET}")
-    print()
+    sys.stdout.write(
+        f"  {C.DIM}{_s('label_permission', 'Permission')}: {perm_label}{C.RESET}\n"
+        f"  {C.DIM}{_s('label_slash_hint', 'Type / to see command list')}{C.RESET}\n"
+        "\n"
+    )
+    sys.stdout.flush()
 
     last_ctrl_c = 0.0
     ctrl_c_count = 0
@@ -55,29 +120,17 @@ def repl():
                 # Check if it's a dragged image file
                 img = detect_image_path(queued_text)
                 if img is not None:
-                    orig_img = img
-                    img = stabilize_image_path(img)
-                    if img != orig_img:
-                        state.track_temp_file(img)
-                    if not os.path.isfile(img):
-                        dim(_s("msg_image_volatile", "Temp file gone, checking clipboard..."))
-                        clip_img = get_clipboard_image()
-                        if clip_img:
-                            state.track_temp_file(clip_img)
-                            img = clip_img
-                        else:
-                            error(_s("err_image_gone",
-                                "Image file removed by macOS. Use Cmd+Shift+Ctrl+4 to copy screenshot to clipboard, then paste."))
-                            print()
-                            continue
-                    size_kb = os.path.getsize(img) / 1024
+                    accepted = _accept_image(img, state)
+                    if accepted is None:
+                        continue
+                    img, size_kb = accepted
                     success(f"  🖼  {_s('msg_queued_image', 'Queued image detected')} ({size_kb:.0f}KB)")
                     try:
                         img_q = input(
-                            f"  \001{C.DIM}\002{_s('prompt_question', 'Question (Enter=describe)')}: \001{C.RESET}\002"
+                            _question_prompt(config.language)
                         ).strip()
                     except (EOFError, KeyboardInterrupt):
-                        print(f"\n  {C.DIM}{_s('msg_cancelled', 'Cancelled')}{C.RESET}")
+                        print("\n" + _cancelled_msg(config.language))
                         print()
                         continue
                     try:
@@ -91,14 +144,14 @@ def repl():
                     dim(f"{_s('msg_queued_input', 'Queued input detected')}: {queued_text[:60]}...")
                     try:
                         confirm = input(
-                            f"  \001{C.DIM}\002{_s('msg_send_confirm', 'Press Enter to send, n to cancel')}: \001{C.RESET}\002"
+                            _confirm_prompt(config.language)
                         ).strip()
                         if confirm.lower() in ("n", "no", "취소"):
-                            print(f"  {C.DIM}{_s('msg_cancelled', 'Cancelled')}{C.RESET}")
+                            print(_cancelled_msg(config.language))
                             print()
                             continue
                     except (EOFError, KeyboardInterrupt):
-                        print(f"\n  {C.DIM}{_s('msg_cancelled', 'Cancelled')}{C.RESET}")
+                        print("\n" + _cancelled_msg(config.language))
                         print()
                         continue
                     try:
@@ -118,7 +171,7 @@ def repl():
             dim(_s("msg_session_end", "Ending session."))
             break
         except KeyboardInterrupt:
-            now = time.time()
+            now = time.monotonic()
             if now - last_ctrl_c > CTRL_C_WINDOW:
                 ctrl_c_count = 1
             else:
@@ -149,10 +202,10 @@ def repl():
                 success(f"  🖼  {_s('msg_clipboard_image', 'Clipboard image detected')} ({size_kb:.0f}KB)")
                 try:
                     img_question = input(
-                        f"  \001{C.DIM}\002{_s('prompt_question', 'Question (Enter=describe)')}: \001{C.RESET}\002"
+                        _question_prompt(config.language)
                     ).strip()
                 except (EOFError, KeyboardInterrupt):
-                    print(f"\n  {C.DIM}{_s('msg_cancelled', 'Cancelled')}{C.RESET}")
+                    print("\n" + _cancelled_msg(config.language))
                     print()
                     continue
                 try:
@@ -173,35 +226,25 @@ def repl():
             # Extract question from remaining text BEFORE stabilizing
             # (need original path for replacement matching)
             img_question = user_input
-            for variant in [dragged_path, dragged_path.replace(" ", "\\ ")]:
-                img_question = img_question.replace(variant, "")
+            for variant in (dragged_path, dragged_path.replace(" ", "\\ ")):
+                idx = user_input.find(variant)
+                if idx >= 0:
+                    img_question = user_input[:idx] + user_input[idx + len(variant):]
+                    break
             img_question = img_question.strip().strip("'\"").strip()
 
-            # Stabilize volatile macOS temp paths (screenshot preview drag)
-            stable_path = stabilize_image_path(dragged_path)
-            if stable_path != dragged_path:
-                state.track_temp_file(stable_path)
-            if not os.path.isfile(stable_path):
-                # File already gone — try clipboard image as fallback
-                dim(_s("msg_image_volatile", "Temp file gone, checking clipboard..."))
-                clip_img = get_clipboard_image()
-                if clip_img:
-                    state.track_temp_file(clip_img)
-                    stable_path = clip_img
-                else:
-                    error(_s("err_image_gone",
-                        "Image file removed by macOS. Use Cmd+Shift+Ctrl+4 to copy screenshot to clipboard, then paste."))
-                    print()
-                    continue
-            size_kb = os.path.getsize(stable_path) / 1024
+            accepted = _accept_image(dragged_path, state)
+            if accepted is None:
+                continue
+            stable_path, size_kb = accepted
             success(f"  🖼  {_s('msg_image_detected', 'Image detected')} ({size_kb:.0f}KB)")
             if not img_question:
                 try:
                     img_question = input(
-                        f"  \001{C.DIM}\002{_s('prompt_question', 'Question (Enter=describe)')}: \001{C.RESET}\002"
+                        _question_prompt(config.language)
                     ).strip()
                 except (EOFError, KeyboardInterrupt):
-                    print(f"\n  {C.DIM}{_s('msg_cancelled', 'Cancelled')}{C.RESET}")
+                    print("\n" + _cancelled_msg(config.language))
                     print()
                     continue
             else:
@@ -242,3 +285,5 @@ def repl():
 
     # ── Session cleanup ──
     state.cleanup_temp_files()
+    shutdown_prefetch()
+    close_translation_worker()
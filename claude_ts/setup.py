@@ -20,6 +20,7 @@ def select_language() -> str:
         print(f"  {C.BOLD}{i}.{C.RESET} {lang['name']} ({lang['name_en']})")
     print()
 
+    by_code = {lang["code"]: lang for lang in langs}
     while True:
         try:
             choice = input(f"  {C.DIM}>{C.RESET} ").strip()
@@ -31,21 +32,15 @@ def select_language() -> str:
             continue
 
         # Accept number or language code
-        try:
+        if choice.isdecimal():
             idx = int(choice) - 1
             if 0 <= idx < len(langs):
                 selected = langs[idx]
                 break
-        except ValueError:
-            # Try matching by code
-            for lang in langs:
-                if lang["code"] == choice.lower():
-                    selected = lang
-                    break
-            else:
-                print(f"  {C.RED}Invalid choice. Enter 1-{len(langs)} or a language code.{C.RESET}")
-                continue
-            break
+        else:
+            selected = by_code.get(choice.lower())
+            if selected:
+                break
 
         print(f"  {C.RED}Invalid choice. Enter 1-{len(langs)} or a language code.{C.RESET}")
 
@@ -5,9 +5,29 @@ from __future__ import annotations
 import json
 import os
 import re
-import threading
 import time
 import uuid
+from collections import deque
+from types import MappingProxyType
+
+try:
+    import orjson
+
+    def _loads(data: bytes | str):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (lone surrogates, NaN); defer to json
+            return json.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _loads(data: bytes | str):
+        return json.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
 
 BASE_DIR = os.path.join(os.path.expanduser("~"), ".claude-ts")
 SESSIONS_DIR = os.path.join(BASE_DIR, "sessions")
@@ -23,7 +43,16 @@ class Config:
     dangerously_skip_permissions: bool = False
     translate_backend: str = "claude"  # "claude" or "ollama"
     ollama_model: str = ""             # e.g. "gemma3:4b"
-    language: str = ""                 # language code, e.g. "ko", "th"
+    _language: str = ""                # language code, e.g. "ko", "th"
+
+    @property
+    def language(self) -> str:
+        return self._language
+
+    @language.setter
+    def language(self, code: str):
+        self._language = code
+        _set_ui_strings(code)
 
 
 config = Config()
@@ -31,100 +60,158 @@ config = Config()
 
 # ── Language Config ─────────────────────────────────────────────────────────
 
-_lang_cache: dict | None = None
-_lang_cache_all: dict[str, dict] = {}  # multi-language cache for detect_language
-_lang_lock = threading.Lock()
+_ASCII_CHARS = "".join(map(chr, range(128)))
 
 
-def available_languages() -> list[dict]:
-    """List all bundled language configs, sorted by code."""
-    langs = []
+def _load_bundled_languages() -> dict[str, dict]:
+    """Read every bundled language JSON once, precompiling detect_regex.
+
+    "_detect_ascii" records whether the pattern can match any ASCII
+    character; when it cannot, pure-ASCII text is rejected without a scan.
+    """
+    langs: dict[str, dict] = {}
     if not os.path.isdir(BUNDLED_LANGUAGES_DIR):
         return langs
     for fname in sorted(os.listdir(BUNDLED_LANGUAGES_DIR)):
         if not fname.endswith(".json"):
             continue
         try:
-            with open(os.path.join(BUNDLED_LANGUAGES_DIR, fname), encoding="utf-8") as f:
-                data = json.load(f)
-                langs.append({"code": data["code"], "name": data["name"], "name_en": data["name_en"]})
+            with open(os.path.join(BUNDLED_LANGUAGES_DIR, fname), "rb") as f:
+                data = _loads(f.read())
+            if "detect_regex" in data:
+                data["_detect_re"] = re.compile(data["detect_regex"])
+                data["_detect_ascii"] = bool(data["_detect_re"].search(_ASCII_CHARS))
+            langs[data["code"]] = data
         except (json.JSONDecodeError, OSError, KeyError):
             continue
     return langs
 
 
+# Bundled languages ship with the package, so they are loaded eagerly at
+# import and every read below is a lock-free lookup.
+LANGUAGES: MappingProxyType[str, dict] = MappingProxyType(_load_bundled_languages())
+LANGUAGES_LIST: tuple[dict, ...] = tuple(
+    {"code": d["code"], "name": d["name"], "name_en": d["name_en"]}
+    for d in LANGUAGES.values()
+    if "name" in d and "name_en" in d
+)
+
+
+def _build_detect_union() -> tuple[re.Pattern | None, list[str | None]]:
+    """Combine every language's detect_regex into one alternation of groups.
+
+    Returns (pattern, codes) where codes[m.lastindex] is the language code of
+    the group that matched. Numbered groups, since codes such as "zh-TW" are
+    not valid group names; groups inside a detect_regex map to its code too.
+    """
+    parts: list[str] = []
+    codes: list[str | None] = [None]  # group 0 is the whole match
+    for code, d in LANGUAGES.items():
+        if "detect_regex" in d:
+            parts.append(f"({d['detect_regex']})")
+            codes += [code] * (1 + re.compile(d["detect_regex"]).groups)
+    return (re.compile("|".join(parts)) if parts else None), codes
+
+
+_detect_union, _detect_codes = _build_detect_union()
+_detect_union_ascii = any(d.get("_detect_ascii") for d in LANGUAGES.values())
+
+
+def available_languages() -> tuple[dict, ...]:
+    """List all bundled language configs, sorted by code."""
+    return LANGUAGES_LIST
+
+
 def load_language(code: str) -> dict:
     """Load language config by code. Returns the full language dict."""
-    global _lang_cache
-    with _lang_lock:
-        if _lang_cache and _lang_cache.get("code") == code:
-            return _lang_cache
+    try:
+        return LANGUAGES[code]
+    except KeyError:
+        raise FileNotFoundError(f"Language config not found: {code}") from None
 
-        path = os.path.join(BUNDLED_LANGUAGES_DIR, f"{code}.json")
-        if not os.path.isfile(path):
-            raise FileNotFoundError(f"Language config not found: {code}")
 
-        with open(path, encoding="utf-8") as f:
-            _lang_cache = json.load(f)
-        return _lang_cache
+def detect_language(text: str) -> str | None:
+    """Detect language from text using bundled regex patterns. Returns code or None.
 
+    All patterns are scanned in one pass; the language of the leftmost
+    matching character wins.
+    """
+    if _detect_union is None:
+        return None
+    if not _detect_union_ascii and text.isascii():
+        return None
+    m = _detect_union.search(text)
+    return _detect_codes[m.lastindex] if m else None
 
-def detect_language(text: str) -> str | None:
-    """Detect language from text using bundled regex patterns. Returns code or None."""
-    for lang in available_languages():
-        code = lang["code"]
-        try:
-            # Use multi-language cache to avoid repeated file reads
-            if code not in _lang_cache_all:
-                _lang_cache_all[code] = load_language(code)
-            data = _lang_cache_all[code]
-            if re.search(data["detect_regex"], text):
-                return code
-        except (FileNotFoundError, KeyError):
-            continue
-    return None
 
+# ui_strings of config.language. The dict object is never replaced, only
+# refilled, so the bound _ACTIVE_UI.get imported elsewhere as _s stays valid.
+_current_ui: dict[str, str] = {}
+_ACTIVE_UI: MappingProxyType[str, str] = MappingProxyType(_current_ui)
 
-def get_ui_string(key: str, fallback: str = "") -> str:
-    """Get a localized UI string for the current language."""
-    if not config.language:
-        return fallback
+
+def _set_ui_strings(code: str):
+    """Refill the UI string table for the given language (called on language change)."""
     try:
-        data = load_language(config.language)
-        return data.get("ui_strings", {}).get(key, fallback)
+        strings = load_language(code).get("ui_strings", {}) if code else {}
     except FileNotFoundError:
-        return fallback
+        strings = {}
+    _current_ui.clear()
+    _current_ui.update(strings)
+
+
+def get_ui_string(key: str, fallback: str = "") -> str:
+    """Get a localized UI string for the current language."""
+    return _current_ui.get(key, fallback)
+
 
+# Short alias for get_ui_string — use across all modules.
+# Bound C method: no Python frame per lookup.
+_s = _ACTIVE_UI.get
 
-# Short alias for get_ui_string — use across all modules
-_s = get_ui_string
+
+_user_cfg_cache: tuple[int, dict] | None = None  # (st_mtime_ns, parsed config)
 
 
 def load_user_config() -> dict:
-    """Load user config from ~/.claude-ts/config.json."""
-    if not os.path.isfile(CONFIG_FILE):
+    """Load user config from ~/.claude-ts/config.json.
+
+    The parsed dict is cached and reused while the file's mtime is unchanged.
+    """
+    global _user_cfg_cache
+    try:
+        mtime = os.stat(CONFIG_FILE).st_mtime_ns
+    except OSError:
         return {}
+    if _user_cfg_cache is not None and _user_cfg_cache[0] == mtime:
+        return dict(_user_cfg_cache[1])
     try:
-        with open(CONFIG_FILE, encoding="utf-8") as f:
-            return json.load(f)
+        with open(CONFIG_FILE, "rb") as f:
+            data = _loads(f.read())
     except (json.JSONDecodeError, OSError):
         return {}
+    _user_cfg_cache = (mtime, data)
+    return dict(data)
 
 
 def save_user_config(data: dict):
     """Save user config to ~/.claude-ts/config.json (atomic write)."""
+    global _user_cfg_cache
     import tempfile
-    os.makedirs(BASE_DIR, exist_ok=True)
     try:
         existing = load_user_config()
     except Exception:
         existing = {}
-    existing.update(data)
+    merged = {**existing, **data}
+    if merged == existing and os.path.isfile(CONFIG_FILE):
+        return  # nothing changed — skip the rewrite
+    existing = merged
+    os.makedirs(BASE_DIR, exist_ok=True)
     # Write to temp file then atomically rename to prevent data loss on crash
     fd, tmp_path = tempfile.mkstemp(dir=BASE_DIR, suffix=".tmp")
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            json.dump(existing, f, ensure_ascii=False, indent=2)
+        with os.fdopen(fd, "wb") as f:
+            f.write(_dumps(existing))
         os.replace(tmp_path, CONFIG_FILE)
     except BaseException:
         try:
@@ -132,6 +219,7 @@ def save_user_config(data: dict):
         except OSError:
             pass
         raise
+    _user_cfg_cache = (os.stat(CONFIG_FILE).st_mtime_ns, existing)
 
 
 def init_language():
@@ -155,11 +243,17 @@ def init_translation_backend():
         config.ollama_model = model
 
 
+TIME_FMT = "%Y-%m-%d %H:%M:%S"
 MAX_CONTEXT_TURNS = 3
 MAX_CONTEXT_CHARS = 600
 
 
 class SessionStats:
+    __slots__ = (
+        "input_tokens", "output_tokens", "cache_read_tokens", "turn_count",
+        "tool_count", "thinking_count", "total_cost_usd",
+    )
+
     def __init__(self):
         self.reset()
 
@@ -174,17 +268,27 @@ class SessionStats:
 
 
 class SessionState:
+    __slots__ = (
+        "session_uuid", "stats", "_turn_count_override",
+        "conversation_context", "conversation_history", "session_name",
+        "first_input", "last_assistant_response", "_session_start_time",
+        "started_str", "cwd", "temp_files", "_temp_set",
+    )
+
     def __init__(self):
         self.session_uuid: str = str(uuid.uuid4())
         self.stats: SessionStats = SessionStats()
         self._turn_count_override: int | None = None  # for /resume
-        self.conversation_context: list[dict[str, str]] = []
+        # Recent turns for translation context; appends evict the oldest
+        self.conversation_context: deque[dict[str, str]] = deque(maxlen=MAX_CONTEXT_TURNS)
         self.conversation_history: list[dict[str, str]] = []
         self.session_name: str = ""
         self.first_input: str = ""
         self.last_assistant_response: str = ""
-        self.session_start_time: float = time.time()
+        self.session_start_time: float = time.time()  # also sets started_str
+        self.cwd: str = os.getcwd()  # working directory at session start
         self.temp_files: list[str] = []
+        self._temp_set: set[str] = set()  # O(1) dedup for temp_files
 
     @property
     def turn_count(self) -> int:
@@ -198,9 +302,20 @@ class SessionState:
         """Set turn count override (used by /resume)."""
         self._turn_count_override = value
 
+    @property
+    def session_start_time(self) -> float:
+        return self._session_start_time
+
+    @session_start_time.setter
+    def session_start_time(self, value: float):
+        """Set start time and its formatted form (saved with every record)."""
+        self._session_start_time = value
+        self.started_str = time.strftime(TIME_FMT, time.localtime(value))
+
     def track_temp_file(self, path: str):
         """Register a temp file for cleanup on session end."""
-        if path and path not in self.temp_files:
+        if path and path not in self._temp_set:
+            self._temp_set.add(path)
             self.temp_files.append(path)
 
     def cleanup_temp_files(self):
@@ -211,6 +326,7 @@ class SessionState:
             except OSError:
                 pass
         self.temp_files.clear()
+        self._temp_set.clear()
 
     def reset(self):
         self.cleanup_temp_files()
@@ -239,31 +355,49 @@ def save_session_record(state: "SessionState"):
         "model": config.main_model or "default",
         "turns": state.turn_count,
         "cost": state.stats.total_cost_usd,
-        "cwd": os.getcwd(),
+        "cwd": state.cwd,
         "preview": state.first_input[:80] if state.first_input else "",
-        "started": time.strftime(
-            "%Y-%m-%d %H:%M:%S",
-            time.localtime(state.session_start_time),
-        ),
-        "updated": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "started": state.started_str,
+        "updated": time.strftime(TIME_FMT),
     }
     path = os.path.join(SESSIONS_DIR, f"{state.session_uuid}.json")
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(record, f, ensure_ascii=False, indent=2)
+    with open(path, "wb") as f:
+        f.write(_dumps(record))
+
+
+_session_cache: dict[str, tuple[int, dict]] = {}  # path → (st_mtime_ns, record)
 
 
 def list_session_records() -> list[dict]:
-    """List saved session records, newest first."""
+    """List saved session records, newest first.
+
+    Parsed records are cached by path and mtime, so unchanged files are
+    not re-read on subsequent calls.
+    """
+    global _session_cache
     if not os.path.isdir(SESSIONS_DIR):
         return []
     records = []
-    for fname in os.listdir(SESSIONS_DIR):
-        if not fname.endswith(".json"):
-            continue
-        try:
-            with open(os.path.join(SESSIONS_DIR, fname), encoding="utf-8") as f:
-                records.append(json.load(f))
-        except (json.JSONDecodeError, OSError):
-            continue
+    fresh: dict[str, tuple[int, dict]] = {}
+    with os.scandir(SESSIONS_DIR) as it:
+        for entry in it:
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                mtime = entry.stat().st_mtime_ns
+            except OSError:
+                continue
+            cached = _session_cache.get(entry.path)
+            if cached and cached[0] == mtime:
+                record = cached[1]
+            else:
+                try:
+                    with open(entry.path, "rb") as f:
+                        record = _loads(f.read())
+                except (json.JSONDecodeError, OSError):
+                    continue
+            fresh[entry.path] = (mtime, record)
+            records.append(record)
+    _session_cache = fresh
     records.sort(key=lambda r: r.get("updated", ""), reverse=True)
     return records
@@ -10,54 +10,202 @@ import sys
 import threading
 import time
 import unicodedata
+from collections import OrderedDict
+from typing import Callable, Iterator
 
-from claude_ts.state import config, _s
+from claude_ts.state import config, _s, _loads
 from claude_ts.tokens import estimate_tokens, fmt_tokens
 from claude_ts.ui import C, SPINNER, dbg
 
 
 _ANSI_RE = re.compile(r"\033\[[0-9;]*[A-Za-z]")
+_SPIN_N = len(SPINNER)
 
 
-def _char_width(ch: str) -> int:
-    """Return the terminal display width of a single character.
+# One stripped, non-blank line: first to last non-space character, never
+# crossing any line boundary that str.splitlines() recognises.
+_NONBLANK_LINE_RE = re.compile(
+    r"\S(?:[^\n\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]*\S)?"
+)
+
+def _thinking_tail(tail: str, text: str) -> str:
+    """Append a thinking delta to the tracked tail and trim it again.
+
+    The tail starts at the line holding the last non-blank character, so
+    tail.strip() equals full_text.rstrip().rsplit("\n", 1)[-1].strip()
+    without joining the whole block on every delta.  A very long line keeps
+    only its head, which is all the 50-char preview needs, plus any line
+    break already seen after it.
+    """
+    tail += text
+    body = tail.rstrip()
+    if not body:
+        return ""
+    start = body.rfind("\n") + 1
+    tail = tail[start:]
+    if len(tail) > 256:
+        line = body[start:].lstrip()
+        head = line[:256]
+        if len(line) > 256 and len(head.rstrip()) > 51:
+            # Keep a line break that already follows the long line, so the
+            # next non-blank delta still starts a new preview line.
+            gap = tail[len(body) - start:]
+            return head + ("\n" if "\n" in gap else gap[:1])
+    return tail
+
+
+# Dedup tables keep at most this many keys; the oldest are evicted first.
+_SEEN_CAP = 8192
+
+
+class _BoundedSet(OrderedDict):
+    """Insertion-ordered set of keys that forgets its oldest past maxlen.
+
+    Membership tests stay the C-level dict lookup; only add() is Python.
+    """
+
+    def __init__(self, maxlen: int = _SEEN_CAP):
+        super().__init__()
+        self.maxlen = maxlen
+
+    def add(self, key: str):
+        self[key] = None
+        if len(self) > self.maxlen:
+            self.popitem(last=False)
+
+
+class _ActiveBlock:
+    """A content block being streamed, between content_block_start and _stop."""
+
+    __slots__ = ("type", "name", "id", "json_buf", "text_buf", "tail", "t0")
+
+    def __init__(self, type: str, name: str, id: str, t0: float):
+        self.type = type
+        self.name = name
+        self.id = id
+        # Deltas are appended as UTF-8 into one buffer and decoded once at
+        # block stop; surrogatepass keeps lone surrogates round-tripping.
+        self.json_buf = bytearray()
+        self.text_buf = bytearray()
+        self.tail: str = ""  # thinking: the line holding the last non-blank text
+        self.t0 = t0
+
+
+_ZERO_WIDTH = (0x200B, 0x200C, 0x200D, 0xFEFF, 0x00AD)
+_EAW_CELLS = {"W": 2, "F": 2, "A": 1, "N": 1, "Na": 1, "H": 1}
+
+
+# Supplemental symbols & emoji blocks (U+1F000+) are virtually all 2 cells,
+# so the table only has to cover codepoints below this bound.
+_WIDTH_TABLE_END = 0x1F000
+
+
+def _build_width_table() -> bytearray:
+    """Terminal cell widths of every codepoint below _WIDTH_TABLE_END, in one pass.
 
     Emojis and East Asian wide characters occupy 2 terminal cells.
     Variation selectors and zero-width joiners occupy 0.
     """
-    cp = ord(ch)
-    # Control characters
-    if cp < 32 or cp == 127:
-        return 0
-    # Zero-width: variation selectors, ZWJ, zero-width space, soft hyphen
-    if 0xFE00 <= cp <= 0xFE0F or cp in (0x200B, 0x200C, 0x200D, 0xFEFF, 0x00AD):
-        return 0
-    # Supplemental symbols & emoji blocks (U+1F000+): virtually all 2 cells
-    if cp >= 0x1F000:
-        return 2
     # East Asian Width: Wide and Fullwidth (CJK, emoji with W property)
     # This correctly handles ⚡ U+26A1 (W), ✅ U+2705 (W), 📄 etc.
     # while leaving ✓ U+2713 (N) and box drawing │├└ (A) as 1 cell
-    eaw = unicodedata.east_asian_width(ch)
-    if eaw in ('W', 'F'):
-        return 2
-    return 1
+    table = bytearray(map(
+        _EAW_CELLS.__getitem__,
+        map(unicodedata.east_asian_width, map(chr, range(_WIDTH_TABLE_END))),
+    ))
+    # Control characters; zero-width: variation selectors, ZWJ,
+    # zero-width space, soft hyphen
+    for cp in (*range(32), 127, *range(0xFE00, 0xFE10), *_ZERO_WIDTH):
+        table[cp] = 0
+    return table
+
+
+_WIDTH_TABLE = _build_width_table()
+
+
+def _char_width(ch: str) -> int:
+    """Return the terminal display width of a single character (one table load)."""
+    cp = ord(ch)
+    return _WIDTH_TABLE[cp] if cp < _WIDTH_TABLE_END else 2
+
+
+# Terminal width, re-queried at most every _COLS_TTL seconds. No SIGWINCH
+# handler: replacing readline's C-level one would break line editing.
+_COLS_TTL = 0.5
+_term_cols: tuple[float, int] | None = None  # (time.monotonic(), columns)
+
+
+def _terminal_cols() -> int:
+    """Terminal width in columns, cached for _COLS_TTL seconds."""
+    global _term_cols
+    now = time.monotonic()
+    cached = _term_cols
+    if cached is not None and now - cached[0] < _COLS_TTL:
+        return cached[1]
+    try:
+        cols = os.get_terminal_size().columns
+    except (OSError, ValueError):
+        cols = 80
+    _term_cols = (now, cols)
+    return cols
+
+
+def _write_out(text: str):
+    """Write a composed frame to the stdout fd in one os.write call.
+
+    Skips the TextIOWrapper layer; falls back to sys.stdout.write when
+    stdout has no real file descriptor (e.g. redirected to a StringIO).
+    """
+    out = sys.stdout
+    try:
+        fd = out.fileno()
+    except (AttributeError, OSError, ValueError):
+        out.write(text)
+        out.flush()
+        return
+    out.flush()  # anything print()ed earlier must land before this frame
+    data = memoryview(text.encode(out.encoding or "utf-8", out.errors or "strict"))
+    while data:
+        data = data[os.write(fd, data):]
 
 
 def _display_width(text: str) -> int:
     """Return terminal display width of text, excluding ANSI escapes."""
-    return sum(_char_width(ch) for ch in _ANSI_RE.sub("", text))
+    stripped = _ANSI_RE.sub("", text) if "\033" in text else text
+    # Printable ASCII is one cell per character
+    if stripped.isascii() and stripped.isprintable():
+        return len(stripped)
+    table = _WIDTH_TABLE
+    end = _WIDTH_TABLE_END
+    total = 0
+    for cp in map(ord, stripped):
+        total += table[cp] if cp < end else 2
+    return total
 
 
-def _truncate_line(text: str, cols: int) -> str:
-    """Truncate a line so its display width fits within `cols` terminal cells.
+def _fit_line(text: str, cols: int) -> tuple[str, int]:
+    """Truncate a line to `cols` terminal cells; return (line, display width).
 
     Properly accounts for wide characters (emojis, CJK) that occupy
-    2 terminal cells.  Preserves ANSI escape sequences.
+    2 terminal cells.  Preserves ANSI escape sequences.  The width is
+    measured during the same scan, so callers need no second pass.
     """
     if cols <= 0:
-        return text
+        return text, _display_width(text)
+    # Fast path: printable ASCII that already fits needs no per-char walk
+    has_esc = "\033" in text
+    if text.isascii():
+        visible = _ANSI_RE.sub("", text) if has_esc else text
+        if visible.isprintable() and len(visible) <= cols:
+            return text, len(visible)
     width = 0
+    if not has_esc:
+        for i, ch in enumerate(text):
+            w = _char_width(ch)
+            if width + w > cols:
+                return text[:i] + C.RESET, width
+            width += w
+        return text, width
     i = 0
     last_good = 0
     while i < len(text):
@@ -68,11 +216,16 @@ def _truncate_line(text: str, cols: int) -> str:
             continue
         w = _char_width(text[i])
         if width + w > cols:
-            return text[:last_good] + C.RESET
+            return text[:last_good] + C.RESET, width
         width += w
         i += 1
         last_good = i
-    return text
+    return text, width
+
+
+def _truncate_line(text: str, cols: int) -> str:
+    """Truncate a line so its display width fits within `cols` terminal cells."""
+    return _fit_line(text, cols)[0]
 
 
 TOOL_ICONS = {
@@ -100,27 +253,45 @@ def short_model(model: str) -> str:
     return model.split("-")[0] if model else "?"
 
 
+def _bash_summary(input_data: dict) -> str:
+    cmd = input_data.get("command", "")
+    return cmd[:70] + ("..." if len(cmd) > 70 else "")
+
+
+def _path_summary(input_data: dict) -> str:
+    fp = input_data.get("file_path", "")
+    # Shorten long paths: keep last 2 components
+    parts = fp.split("/")
+    return "/".join(parts[-2:]) if len(parts) > 3 else fp
+
+
+def _grep_summary(input_data: dict) -> str:
+    pat = input_data.get("pattern", "")
+    path = input_data.get("path", "")
+    return f"/{pat}/" + (f" in {path}" if path else "")
+
+
+def _web_summary(input_data: dict) -> str:
+    return input_data.get("url", input_data.get("query", ""))
+
+
+_SUMMARY_HANDLERS = {
+    "Bash":      _bash_summary,
+    "Read":      _path_summary,
+    "Write":     _path_summary,
+    "Edit":      _path_summary,
+    "Glob":      lambda d: d.get("pattern", ""),
+    "Grep":      _grep_summary,
+    "Task":      lambda d: d.get("description", ""),
+    "WebFetch":  _web_summary,
+    "WebSearch": _web_summary,
+}
+
+
 def tool_summary(name: str, input_data: dict) -> str:
     """One-line summary of a tool invocation."""
-    if name == "Bash":
-        cmd = input_data.get("command", "")
-        return cmd[:70] + ("..." if len(cmd) > 70 else "")
-    elif name in ("Read", "Write", "Edit"):
-        fp = input_data.get("file_path", "")
-        # Shorten long paths: keep last 2 components
-        parts = fp.split("/")
-        return "/".join(parts[-2:]) if len(parts) > 3 else fp
-    elif name == "Glob":
-        return input_data.get("pattern", "")
-    elif name == "Grep":
-        pat = input_data.get("pattern", "")
-        path = input_data.get("path", "")
-        return f"/{pat}/" + (f" in {path}" if path else "")
-    elif name == "Task":
-        return input_data.get("description", "")
-    elif name in ("WebFetch", "WebSearch"):
-        return input_data.get("url", input_data.get("query", ""))
-    return str(input_data)[:60]
+    handler = _SUMMARY_HANDLERS.get(name)
+    return handler(input_data) if handler else str(input_data)[:60]
 
 
 class StreamParser:
@@ -143,13 +314,35 @@ class StreamParser:
         └── ✅ 완료 (도구 7회, 서브에이전트 2개)
     """
 
+    __slots__ = (
+        "text_parts", "active_blocks",
+        "tool_count", "sub_tool_count",
+        "main_model", "header_printed", "task_counter",
+        "root_items", "task_index", "_last_task", "_groups_cache",
+        "seen_tool_ids", "_seen_message_ids", "rendered_lines",
+        "_last_frame_key", "_dirty", "_last_render_ts",
+        "_thinking_node", "thinking_count", "_thinking_total_tokens",
+        "_thinking_start", "_thinking_total_elapsed",
+        "_seen_thinking_prefixes", "_current_thinking_prefix",
+        "input_tokens", "output_tokens", "cache_read_tokens",
+        "cache_creation_tokens", "total_cost_usd", "on_result",
+        "_s_thinking", "_s_working_on", "_s_tool_running", "_s_subagent_start",
+        "status", "_status_base", "_status_start", "_last_status_render",
+        "_status_prefix", "_status_body", "_status_key", "_status_fits",
+        "spin_idx", "_spin_lock", "_spin_thread", "_spin_stop",
+    )
+
     PIPE   = "│"
     BRANCH = "├──"
     END    = "└──"
 
     def __init__(self):
+        global _term_cols
         self.text_parts: list[str] = []
-        self.active_blocks: dict[int, dict] = {}
+        self.active_blocks: list[_ActiveBlock | None] = []  # content blocks by stream index
+
+        # Re-measure the terminal at the start of every run
+        _term_cols = None
 
         # Counters
         self.tool_count: int = 0
@@ -162,17 +355,24 @@ class StreamParser:
 
         # Grouped tree: ordered root-level items
         self.root_items: list[dict] = []
-        self.task_index: dict[str, int] = {}  # tool_use_id → root_items index
-        self.seen_tool_ids: set[str] = set()  # dedup tool_use blocks by ID
-        self._seen_message_ids: set[str] = set()  # dedup entire assistant messages
+        self.task_index: dict[str, dict] = {}  # tool_use_id → task item in root_items
+        self._last_task: dict | None = None  # newest task item
+        self._groups_cache: tuple[int, list] | None = None  # (len(root_items), groups)
+        self.seen_tool_ids: _BoundedSet = _BoundedSet()  # dedup tool_use blocks by ID
+        self._seen_message_ids: _BoundedSet = _BoundedSet()  # dedup entire assistant messages
         self.rendered_lines: int = 0
+        self._last_frame_key: tuple[int, str] | None = None  # (cols, frame sans spinner) on screen
+        self._dirty: bool = False  # tree changed but its redraw was deferred
+        self._last_render_ts: float = 0.0  # time.monotonic() of the last redraw
 
-        # Thinking state — single summary node (defensive search approach)
+        # Thinking state — single summary node, referenced directly
+        self._thinking_node: dict | None = None
         self.thinking_count: int = 0
         self._thinking_total_tokens: int = 0
         self._thinking_start: float = 0.0  # when current thinking block started
         self._thinking_total_elapsed: float = 0.0  # accumulated thinking time
-        self._seen_thinking_prefixes: set[str] = set()  # dedup thinking blocks by content prefix
+        self._seen_thinking_prefixes: _BoundedSet = _BoundedSet()  # dedup thinking blocks by content prefix
+        self._current_thinking_prefix: str = ""  # prefix of the block being streamed
 
         # Token usage tracking
         self.input_tokens: int = 0
@@ -181,14 +381,28 @@ class StreamParser:
         self.cache_creation_tokens: int = 0
         self.total_cost_usd: float = 0.0
 
+        # Called with the final answer text as soon as the result event arrives
+        self.on_result: Callable[[str], None] | None = None
+
+        # Status strings used per event; the UI language is fixed for a run
+        self._s_thinking: str = _s("msg_thinking", "Thinking...")
+        self._s_working_on: str = _s("msg_working_on", "working...")
+        self._s_tool_running: str = _s("msg_tool_running", "running...")
+        self._s_subagent_start: str = _s("msg_subagent_start", "Sub-agent starting...")
+
         # Live status line (spinner)
         self.status: str = ""
         self._status_base: str = ""  # base status text (without elapsed time)
         self._status_start: float = 0.0  # when current status was set
         self._last_status_render: float = 0.0  # throttle: last time status triggered re-render
+        self._status_prefix: str = f"  {C.DIM}  "  # status line text before the spinner char
+        self._status_body: str = ""  # status line text after the spinner char
+        self._status_key: tuple[str, int] | None = None  # (status, cols) _status_body was built for
+        self._status_fits: bool = True  # whether the status line needs no truncation
         self.spin_idx: int = 0
         self._spin_lock = threading.RLock()
-        self._spin_timer: threading.Timer | None = None
+        self._spin_thread: threading.Thread | None = None
+        self._spin_stop = threading.Event()  # stop signal for _spin_thread
 
     # ── Header (printed once, not part of re-render) ──
 
@@ -227,13 +441,6 @@ class StreamParser:
                         child["status"] = "done"
                         child["elapsed"] = now - child.get("t0", now)
 
-    def _find_thinking_node(self) -> dict | None:
-        """Find existing thinking summary node by icon. Defensive approach."""
-        for item in self.root_items:
-            if item["type"] == "tool" and item.get("icon") == "⏺":
-                return item
-        return None
-
     def _thinking_label(self) -> str:
         """Build the thinking summary label from current stats."""
         if self.thinking_count > 1:
@@ -251,22 +458,23 @@ class StreamParser:
 
     def _make_thinking_preview(self, text: str) -> list[str]:
         """Generate preview lines from thinking content."""
-        raw_lines = [l.strip() for l in text.strip().splitlines() if l.strip()]
+        raw_lines = _NONBLANK_LINE_RE.findall(text)
         if not raw_lines:
             return []
+        dim, reset = C.DIM, C.RESET
         details = []
         for line in raw_lines[:self.MAX_THINKING_PREVIEW]:
             truncated = line[:80] + ("..." if len(line) > 80 else "")
-            details.append(f"{C.DIM}  {truncated}{C.RESET}")
+            details.append(f"{dim}  {truncated}{reset}")
         if len(raw_lines) > self.MAX_THINKING_PREVIEW:
-            details.append(f"{C.DIM}  ... +{len(raw_lines) - self.MAX_THINKING_PREVIEW} lines{C.RESET}")
+            details.append(f"{dim}  ... +{len(raw_lines) - self.MAX_THINKING_PREVIEW} lines{reset}")
         return details
 
     def _add_thinking_to_tree(self, text: str, t0: float, elapsed: float):
         """Add thinking to the tree as a SINGLE summary node.
 
         Uses _seen_thinking_prefixes for dedup (streaming + verbose events).
-        Uses defensive search (_find_thinking_node) to guarantee only one node.
+        Keeps the node in _thinking_node to guarantee only one node.
 
         Key subtlety: verbose mode progressively re-sends the same thinking
         block with increasingly longer text (e.g. 50 chars, then 100, then
@@ -274,7 +482,9 @@ class StreamParser:
         dedup alone fails.  We solve this by checking whether any existing
         prefix is a substring of the new one (progressive growth of same
         block) — in that case we UPDATE the existing node without inflating
-        thinking_count.
+        thinking_count.  Progressive updates almost always continue the block
+        last seen, so _current_thinking_prefix is compared first and the full
+        scan only runs when a new block starts.
 
         Must be called under _spin_lock.
         """
@@ -284,12 +494,16 @@ class StreamParser:
 
         # Check if this is a progressive update of an existing thinking block:
         # the new (longer) prefix starts with an already-seen shorter prefix.
-        is_progressive_update = False
-        for seen in self._seen_thinking_prefixes:
-            if prefix.startswith(seen) or seen.startswith(prefix):
-                is_progressive_update = True
-                break
+        cur = self._current_thinking_prefix
+        if cur and (prefix.startswith(cur) or cur.startswith(prefix)):
+            is_progressive_update = True
+        else:
+            is_progressive_update = any(
+                prefix.startswith(seen) or seen.startswith(prefix)
+                for seen in self._seen_thinking_prefixes
+            )
         self._seen_thinking_prefixes.add(prefix)
+        self._current_thinking_prefix = prefix
 
         est_tokens = estimate_tokens(text)
 
@@ -306,32 +520,34 @@ class StreamParser:
 
         label = self._thinking_label()
         preview = self._make_thinking_preview(text)
-        existing = self._find_thinking_node()
+        existing = self._thinking_node
 
         if existing:
             existing["label"] = label
             existing["elapsed"] = self._thinking_total_elapsed
             existing["details"] = preview
         else:
-            self.root_items.append({
+            self._thinking_node = {
                 "type": "tool", "icon": "⏺",
                 "label": label,
                 "details": preview,
                 "status": "done", "t0": t0, "elapsed": self._thinking_total_elapsed,
-            })
+            }
+            self.root_items.append(self._thinking_node)
 
         return True  # tree updated
 
     def _status_suffix(self, item: dict, spin_ch: str) -> str:
         """Return a status suffix string for a tree item."""
+        green, dim, reset = C.GREEN, C.DIM, C.RESET
         st = item.get("status", "")
         if st == "done":
             elapsed = item.get("elapsed", 0)
             if elapsed >= 1:
-                return f" {C.GREEN}✓{C.RESET}{C.DIM} {elapsed:.1f}s{C.RESET}"
-            return f" {C.GREEN}✓{C.RESET}"
+                return f" {green}✓{reset}{dim} {elapsed:.1f}s{reset}"
+            return f" {green}✓{reset}"
         if st == "running":
-            return f" {C.DIM}{spin_ch}{C.RESET}"
+            return f" {dim}{spin_ch}{reset}"
         return ""
 
     # ── Tree rendering (ANSI cursor-based re-render) ──
@@ -345,10 +561,13 @@ class StreamParser:
         return label.split(":")[0].strip() if ":" in label else ""
 
     def _group_consecutive(self, items: list[dict]) -> list[tuple[str, list[dict]]]:
-        """Group consecutive same-type tool items. Returns [(key, [items])]."""
+        """Group consecutive same-type tool items. Returns [(key, [items])].
+
+        Items without a "type" (sub-agent children) are treated as tools.
+        """
         groups: list[tuple[str, list[dict]]] = []
         for item in items:
-            if item["type"] != "tool":
+            if item.get("type", "tool") != "tool":
                 groups.append(("_single", [item]))
                 continue
             name = self._tool_name(item)
@@ -362,113 +581,129 @@ class StreamParser:
         self, name: str, items: list[dict], spin_ch: str, prefix: str = "  ",
     ) -> str:
         """Render a collapsed group line."""
+        green, dim, cyan, reset = C.GREEN, C.DIM, C.CYAN, C.RESET
         icon = items[0]["icon"]
         count = len(items)
         done = sum(1 for i in items if i.get("status") == "done")
         running = count - done
 
         if running > 0:
-            status = f" {C.DIM}{spin_ch} ({done}/{count}){C.RESET}"
+            status = f" {dim}{spin_ch} ({done}/{count}){reset}"
         elif done == count:
             total_elapsed = sum(i.get("elapsed", 0) for i in items)
             if total_elapsed >= 1:
-                status = f" {C.GREEN}✓{C.RESET}{C.DIM} {total_elapsed:.1f}s{C.RESET}"
+                status = f" {green}✓{reset}{dim} {total_elapsed:.1f}s{reset}"
             else:
-                status = f" {C.GREEN}✓{C.RESET}"
+                status = f" {green}✓{reset}"
         else:
             status = ""
 
         return (
-            f"{prefix}{C.DIM}{self.BRANCH} {icon} {name} "
-            f"{C.CYAN}×{count}{C.RESET}{status}"
+            f"{prefix}{dim}{self.BRANCH} {icon} {name} "
+            f"{cyan}×{count}{reset}{status}"
         )
 
-    def _build_tree_lines(self) -> list[str]:
-        """Build display lines from current tree state + status spinner."""
-        spin_ch = SPINNER[self.spin_idx % len(SPINNER)]
+    def _build_tree_lines(self) -> Iterator[str]:
+        """Yield display lines from current tree state + status spinner."""
+        green, dim, cyan, reset = C.GREEN, C.DIM, C.CYAN, C.RESET
+        pipe, branch, end = self.PIPE, self.BRANCH, self.END
+        spin_ch = SPINNER[self.spin_idx % _SPIN_N]
         self.spin_idx += 1
-        lines = []
 
-        groups = self._group_consecutive(self.root_items)
-        for key, items in groups:
+        # root_items is append-only and grouping ignores status, so the
+        # grouping only needs rebuilding when the item count changes.
+        n_items = len(self.root_items)
+        if self._groups_cache is None or self._groups_cache[0] != n_items:
+            self._groups_cache = (n_items, self._group_consecutive(self.root_items))
+        for key, items in self._groups_cache[1]:
             # Collapsed group
             if key != "_single" and len(items) >= self.COLLAPSE_THRESHOLD:
-                lines.append(self._render_collapsed(key, items, spin_ch))
+                yield self._render_collapsed(key, items, spin_ch)
                 continue
 
             # Individual items
             for item in items:
                 suffix = self._status_suffix(item, spin_ch)
                 if item["type"] == "tool":
-                    lines.append(
-                        f"  {C.DIM}{self.BRANCH} {item['icon']} {item['label']}{C.RESET}{suffix}"
+                    yield (
+                        f"  {dim}{branch} {item['icon']} {item['label']}{reset}{suffix}"
                     )
-                    for detail in item.get("details", []):
-                        lines.append(f"  {C.DIM}{self.PIPE}{C.RESET}      {detail}")
+                    for detail in self._item_details(item):
+                        yield f"  {dim}{pipe}{reset}      {detail}"
                 elif item["type"] == "task":
-                    lines.append(
-                        f"  {C.DIM}{self.BRANCH} {item['icon']} "
-                        f"{C.CYAN}#{item['num']}{C.RESET} "
-                        f"{C.DIM}[{item['model']}] {item['desc']}{C.RESET}{suffix}"
+                    yield (
+                        f"  {dim}{branch} {item['icon']} "
+                        f"{cyan}#{item['num']}{reset} "
+                        f"{dim}[{item['model']}] {item['desc']}{reset}{suffix}"
                     )
                     # Collapse sub-agent children too
                     children = item.get("children", [])
-                    child_groups = self._group_consecutive(
-                        [{"type": "tool", **c} for c in children],
-                    )
+                    cached = item.get("_child_groups")
+                    if cached is None or cached[0] != len(children):
+                        cached = (len(children), self._group_consecutive(children))
+                        item["_child_groups"] = cached
+                    child_groups = cached[1]
                     flat_idx = 0
                     for ckey, citems in child_groups:
                         if ckey != "_single" and len(citems) >= self.COLLAPSE_THRESHOLD:
                             flat_idx += len(citems)
                             is_last = flat_idx >= len(children)
-                            conn = self.END if is_last else self.BRANCH
+                            conn = end if is_last else branch
                             icon = citems[0]["icon"]
                             count = len(citems)
                             done = sum(1 for c in citems if c.get("status") == "done")
                             running = count - done
                             if running > 0:
-                                st = f" {C.DIM}{spin_ch} ({done}/{count}){C.RESET}"
+                                st = f" {dim}{spin_ch} ({done}/{count}){reset}"
                             elif done == count:
                                 te = sum(c.get("elapsed", 0) for c in citems)
-                                st = f" {C.GREEN}✓{C.RESET}{C.DIM} {te:.1f}s{C.RESET}" if te >= 1 else f" {C.GREEN}✓{C.RESET}"
+                                st = f" {green}✓{reset}{dim} {te:.1f}s{reset}" if te >= 1 else f" {green}✓{reset}"
                             else:
                                 st = ""
-                            lines.append(
-                                f"  {C.DIM}{self.PIPE}   {conn} {icon} {ckey} "
-                                f"{C.CYAN}×{count}{C.RESET}{st}"
+                            yield (
+                                f"  {dim}{pipe}   {conn} {icon} {ckey} "
+                                f"{cyan}×{count}{reset}{st}"
                             )
                         else:
                             for ci in citems:
                                 flat_idx += 1
                                 is_last = flat_idx >= len(children)
-                                conn = self.END if is_last else self.BRANCH
+                                conn = end if is_last else branch
                                 csuffix = self._status_suffix(ci, spin_ch)
-                                lines.append(
-                                    f"  {C.DIM}{self.PIPE}   {conn} {ci['icon']} "
-                                    f"{ci['label']}{C.RESET}{csuffix}"
+                                yield (
+                                    f"  {dim}{pipe}   {conn} {ci['icon']} "
+                                    f"{ci['label']}{reset}{csuffix}"
                                 )
-                                for detail in ci.get("details", []):
-                                    pipe2 = "    " if is_last else f"{self.PIPE}   "
-                                    lines.append(
-                                        f"  {C.DIM}{self.PIPE}   {pipe2}{C.RESET} {detail}"
+                                for detail in self._item_details(ci):
+                                    pipe2 = "    " if is_last else f"{pipe}   "
+                                    yield (
+                                        f"  {dim}{pipe}   {pipe2}{reset} {detail}"
                                     )
 
         # Spinner status line at the bottom
         if self.status:
-            lines.append(f"  {C.DIM}  {spin_ch} {self.status}{C.RESET}")
-        return lines
+            yield f"  {dim}  {spin_ch} {self.status}{reset}"
 
     # ── Diff details for Edit/Write tools ──
 
     MAX_DETAIL_LINES = 10
 
+    def _item_details(self, item: dict) -> list[str]:
+        """Detail lines of a tree item, built on first display and kept on the item.
+
+        Tool items carry their raw "tool"/"input"; a diff or preview is only
+        produced once the item is actually drawn expanded.
+        """
+        details = item.get("details")
+        if details is None:
+            details = self._make_tool_details(item.get("tool", ""), item.get("input", {}))
+            item["details"] = details
+        return details
+
     def _make_tool_details(self, name: str, input_data: dict) -> list[str]:
         """Generate preview lines for Edit/Write tools."""
-        if name == "Edit":
-            return self._make_edit_diff(input_data)
-        if name == "Write":
-            return self._make_write_preview(input_data)
-        return []
+        builder = self._DETAIL_BUILDERS.get(name)
+        return builder(self, input_data) if builder else []
 
     def _make_edit_diff(self, input_data: dict) -> list[str]:
         """Generate color diff from Edit's old_string/new_string."""
@@ -479,30 +714,36 @@ class StreamParser:
 
         old_lines = old_s.splitlines()
         new_lines = new_s.splitlines()
-        diff = list(difflib.unified_diff(old_lines, new_lines, lineterm="", n=1))
 
-        details = []
-        for d in diff:
-            if d.startswith("---") or d.startswith("+++"):
-                continue
-            if d.startswith("@@"):
-                continue
-            if d.startswith("-"):
-                details.append(f"{C.RED}- {d[1:][:70]}{C.RESET}")
-            elif d.startswith("+"):
-                details.append(f"{C.GREEN}+ {d[1:][:70]}{C.RESET}")
+        if set(old_lines).isdisjoint(new_lines):
+            # No line in common: the diff is every old line removed, then
+            # every new line added — skip difflib's matching entirely.
+            diff = ["-" + l for l in old_lines] + ["+" + l for l in new_lines]
+        else:
+            diff = difflib.unified_diff(old_lines, new_lines, lineterm="", n=1)
+
+        red, green, dim, reset = C.RED, C.GREEN, C.DIM, C.RESET
+        # Keep only -/+ body lines (skip ---/+++ file headers and @@ hunks)
+        changed = [
+            d for d in diff
+            if d[:1] in ("-", "+") and d[:3] not in ("---", "+++")
+        ]
+        details = [
+            f"{red}- {d[1:][:70]}{reset}" if d[0] == "-" else f"{green}+ {d[1:][:70]}{reset}"
+            for d in changed
+        ]
 
         if details:
             # Count before truncation for accurate stats
-            removed = sum(1 for d in details if d.startswith(C.RED))
-            added = sum(1 for d in details if d.startswith(C.GREEN))
+            removed = sum(1 for d in changed if d[0] == "-")
+            added = len(changed) - removed
 
             if len(details) > self.MAX_DETAIL_LINES:
                 total = len(details)
                 details = details[:self.MAX_DETAIL_LINES]
-                details.append(f"{C.DIM}  ... +{total - self.MAX_DETAIL_LINES} more{C.RESET}")
+                details.append(f"{dim}  ... +{total - self.MAX_DETAIL_LINES} more{reset}")
 
-            header = f"{C.DIM}({C.GREEN}+{added}{C.DIM}/{C.RED}-{removed}{C.DIM} lines){C.RESET}"
+            header = f"{dim}({green}+{added}{dim}/{red}-{removed}{dim} lines){reset}"
             details.insert(0, header)
 
         return details
@@ -514,13 +755,18 @@ class StreamParser:
             return []
         lines = content.splitlines()
         total = len(lines)
-        details = [f"{C.DIM}({_s('label_new_file', 'new file')}, {total} lines){C.RESET}"]
-        for line in lines[:4]:
-            details.append(f"{C.GREEN}  {line[:70]}{C.RESET}")
+        green, dim, reset = C.GREEN, C.DIM, C.RESET
+        details = [f"{dim}({_s('label_new_file', 'new file')}, {total} lines){reset}"]
+        details += [f"{green}  {line[:70]}{reset}" for line in lines[:4]]
         if total > 4:
-            details.append(f"{C.DIM}  ...{C.RESET}")
+            details.append(f"{dim}  ...{reset}")
         return details
 
+    _DETAIL_BUILDERS = {
+        "Edit":  _make_edit_diff,
+        "Write": _make_write_preview,
+    }
+
     def start_waiting_spinner(self):
         """Show a waiting spinner before any events arrive."""
         self._set_status(_s("msg_waiting", "Waiting for response... (ESC to cancel)"))
@@ -538,24 +784,43 @@ class StreamParser:
         self.status = text
         if self.header_printed and not config.debug:
             # If no timer running yet, kick one off
-            if self._spin_timer is None:
+            if self._spin_thread is None:
                 self._start_spin_timer()
 
     def _start_spin_timer(self):
-        """Start (or restart) the periodic spinner refresh timer."""
+        """Start (or restart) the spinner refresh thread."""
         self._stop_spin_timer()
         if self.status:
-            t = threading.Timer(0.12, self._spin_tick)
-            t.daemon = True
+            stop = threading.Event()
+            t = threading.Thread(target=self._spin_loop, args=(stop,), daemon=True)
+            self._spin_stop = stop
+            self._spin_thread = t
             t.start()
-            self._spin_timer = t
+        elif self._dirty:
+            # No spinner will run to flush a deferred frame — draw it now
+            with self._spin_lock:
+                self._rerender()
 
     def _stop_spin_timer(self):
-        """Cancel the spinner refresh timer."""
+        """Stop the spinner refresh thread.
+
+        Taken under _spin_lock, so once this returns no further tick renders.
+        """
         with self._spin_lock:
-            if self._spin_timer is not None:
-                self._spin_timer.cancel()
-                self._spin_timer = None
+            if self._spin_thread is not None:
+                self._spin_stop.set()
+                self._spin_thread = None
+
+    def _spin_loop(self, stop: threading.Event):
+        """One long-lived thread per spinner run: tick every 120ms until stopped."""
+        while not stop.wait(0.12):
+            with self._spin_lock:
+                if stop.is_set() or not self.status:
+                    return
+                if self._dirty:
+                    self._rerender()  # flush a frame deferred by _request_rerender
+                else:
+                    self._spin_tick()
 
     def _spin_tick(self):
         """Called periodically. Updates ONLY the status line — no cursor-up."""
@@ -567,12 +832,6 @@ class StreamParser:
                     if elapsed >= 3 and "⏺" not in self._status_base:
                         self.status = f"{self._status_base} ({elapsed:.0f}s)"
                 self._update_status_line()
-            # Schedule next tick inside lock to prevent race with _stop_spin_timer
-            if self.status:
-                t = threading.Timer(0.12, self._spin_tick)
-                t.daemon = True
-                t.start()
-                self._spin_timer = t
 
     def _update_status_line(self):
         """Overwrite ONLY the last line (status). No cursor-up, no ghost lines.
@@ -583,17 +842,40 @@ class StreamParser:
         """
         if self.rendered_lines < 1:
             return
-        spin_ch = SPINNER[self.spin_idx % len(SPINNER)]
+        spin_ch = SPINNER[self.spin_idx % _SPIN_N]
         self.spin_idx += 1
-        status_line = f"  {C.DIM}  {spin_ch} {self.status}{C.RESET}"
-        try:
-            cols = os.get_terminal_size().columns
-        except (OSError, ValueError):
-            cols = 80
-        status_line = _truncate_line(status_line, cols)
+        cols = _terminal_cols()
+        key = (self.status, cols)
+        if key != self._status_key:
+            # Status text changed: rebuild the parts around the spinner char
+            # and measure once whether the whole line fits.
+            self._status_key = key
+            self._status_body = f" {self.status}{C.RESET}"
+            # Spinner frames are all one cell wide, so any frame measures them all
+            self._status_fits = _display_width(
+                self._status_prefix + SPINNER[0] + self._status_body) <= cols
+        if self._status_fits:
+            status_line = self._status_prefix + spin_ch + self._status_body
+        else:
+            status_line = _truncate_line(
+                self._status_prefix + spin_ch + self._status_body, cols)
         # \033[A = up 1, \r = start of line, \033[K = clear to end
-        sys.stdout.write(f"\033[A\r\033[K{status_line}\n")
-        sys.stdout.flush()
+        _write_out(f"\033[A\r\033[K{status_line}\n")
+
+    RENDER_INTERVAL = 0.05  # min seconds between event-driven tree redraws
+
+    def _request_rerender(self):
+        """Redraw now, or defer if the last frame went out under RENDER_INTERVAL ago.
+
+        A deferred frame is flushed by the next spinner tick (or by
+        _start_spin_timer when no spinner will run), so bursts of events —
+        e.g. verbose re-broadcasts — cost one redraw instead of one each.
+        Must be called under _spin_lock.
+        """
+        if time.monotonic() - self._last_render_ts >= self.RENDER_INTERVAL:
+            self._rerender()
+        else:
+            self._dirty = True
 
     def _rerender(self):
         """Full tree redraw. Only called when tree structure actually changes.
@@ -604,27 +886,31 @@ class StreamParser:
         rendered_lines tracks PHYSICAL lines (accounting for any residual
         wrapping from wide characters) so cursor-up always goes back far
         enough to fully erase the previous render.
+
+        A frame that matches the one already on screen (ignoring spinner
+        frames) is not redrawn.
         """
         with self._spin_lock:
-            lines = self._build_tree_lines()
-            try:
-                cols = os.get_terminal_size().columns
-            except (OSError, ValueError):
-                cols = 80
+            self._dirty = False
+            self._last_render_ts = time.monotonic()
+            cols = _terminal_cols()
+            spin_ch = SPINNER[self.spin_idx % _SPIN_N]  # what _build_tree_lines draws
+            lines = list(self._build_tree_lines())
+            frame_key = (cols, "\n".join(lines).replace(spin_ch, ""))
+            if frame_key == self._last_frame_key:
+                return
+            self._last_frame_key = frame_key
             buf = []
             if self.rendered_lines > 0:
                 buf.append(f"\033[{self.rendered_lines}A\033[J")
             physical = 0
             for line in lines:
-                truncated = _truncate_line(line, cols)
+                truncated, w = _fit_line(line, cols)
                 buf.append(truncated + "\n")
-                # Count physical lines: even after truncation, measure actual
-                # display width in case _char_width underestimates some chars
-                w = _display_width(truncated)
-                physical += max(1, -(-w // cols))  # ceiling division
+                # Count physical lines (ceiling division) from the measured width
+                physical += max(1, -(-w // cols))
             if buf:
-                sys.stdout.write("".join(buf))
-                sys.stdout.flush()
+                _write_out("".join(buf))
             self.rendered_lines = physical
 
     def _debug_print_tool(self, name: str, input_data: dict, icon: str,
@@ -647,8 +933,8 @@ class StreamParser:
                     flush=True,
                 )
         else:
-            idx = self.task_index.get(parent_id)
-            tnum = self.root_items[idx]["num"] if idx is not None else "?"
+            task = self.task_index.get(parent_id)
+            tnum = task["num"] if task is not None else "?"
             summary = tool_summary(name, input_data)
             print(
                 f"  {C.DIM}{self.PIPE}  #{tnum} · {icon} {name}: {summary}{C.RESET}",
@@ -656,6 +942,7 @@ class StreamParser:
             )
 
     def _print_footer(self):
+        dim, reset = C.DIM, C.RESET
         # Mark all remaining running tools as done, then render final state
         self._mark_running_done()
         self._stop_spin_timer()
@@ -686,15 +973,15 @@ class StreamParser:
             if self.total_cost_usd > 0:
                 cost_str = f" · ${self.total_cost_usd:.4f}"
             token_line = (
-                f"  {C.DIM}{self.PIPE}   "
+                f"  {dim}{self.PIPE}   "
                 f"📊 {_s('label_footer_tokens', 'Tokens')}: {' / '.join(token_parts)} "
-                f"({_s('label_total', 'Total')} {fmt_tokens(total)}{cost_str}){C.RESET}"
+                f"({_s('label_total', 'Total')} {fmt_tokens(total)}{cost_str}){reset}"
             )
 
-        print(f"  {C.DIM}{self.PIPE}{C.RESET}", flush=True)
+        print(f"  {dim}{self.PIPE}{reset}", flush=True)
         if token_line:
             print(token_line, flush=True)
-        print(f"  {C.DIM}{self.END} ✅ {_s('label_footer_done', 'Done')} ({summary}){C.RESET}", flush=True)
+        print(f"  {dim}{self.END} ✅ {_s('label_footer_done', 'Done')} ({summary}){reset}", flush=True)
 
     # ── Event handling ──
 
@@ -704,7 +991,7 @@ class StreamParser:
             return
 
         try:
-            data = json.loads(raw_line)
+            data = _loads(raw_line)
         except json.JSONDecodeError:
             dbg(f"[non-json] {raw_line[:120]}")
             return
@@ -736,6 +1023,8 @@ class StreamParser:
             result_text = event.get("result", "")
             if result_text:
                 self.text_parts = [result_text]
+                if self.on_result is not None:
+                    self.on_result(result_text)
             # result event carries final usage and cost
             if "usage" in event:
                 self._collect_usage(event["usage"])
@@ -756,75 +1045,83 @@ class StreamParser:
         index = event.get("index", -1)
         block = event.get("content_block", {})
         now = time.time()
-        self.active_blocks[index] = {
-            "type": block.get("type", ""),
-            "name": block.get("name", ""),
-            "id": block.get("id", ""),
-            "json_parts": [],
-            "text_parts": [],
-            "t0": now,
-        }
         if block.get("type") == "thinking":
             self._thinking_start = now
+        if index < 0:
+            return  # block indices are small non-negative ints; ignore malformed
+        slots = self.active_blocks
+        if index >= len(slots):
+            slots.extend([None] * (index + 1 - len(slots)))
+        slots[index] = _ActiveBlock(
+            block.get("type", ""), block.get("name", ""), block.get("id", ""), now,
+        )
 
     def _on_block_delta(self, event: dict):
         index = event.get("index", -1)
         delta = event.get("delta", {})
         dtype = delta.get("type", "")
-        block = self.active_blocks.get(index)
+        slots = self.active_blocks
+        block = slots[index] if 0 <= index < len(slots) else None
         if not block:
             return
         if dtype == "text_delta":
-            block["text_parts"].append(delta.get("text", ""))
+            block.text_buf += delta.get("text", "").encode("utf-8", "surrogatepass")
         elif dtype == "input_json_delta":
-            block["json_parts"].append(delta.get("partial_json", ""))
+            block.json_buf += delta.get("partial_json", "").encode("utf-8", "surrogatepass")
         elif dtype == "thinking_delta":
             text = delta.get("thinking", "")
-            block["text_parts"].append(text)
+            block.text_buf += text.encode("utf-8", "surrogatepass")
             # Live preview of thinking in status line
-            full = "".join(block["text_parts"])
-            last_line = full.rstrip().rsplit("\n", 1)[-1].strip()
-            elapsed = time.time() - (self._thinking_start or block.get("t0", time.time()))
+            block.tail = tail = _thinking_tail(block.tail, text)
+            last_line = tail.strip()
+            elapsed = time.time() - (self._thinking_start or block.t0)
             elapsed_str = f"{elapsed:.0f}s"
             if last_line:
                 preview = last_line[:50] + ("..." if len(last_line) > 50 else "")
                 self._set_status(f'⏺ ({elapsed_str}) "{preview}"')
             else:
-                self._set_status(f"⏺ {_s('msg_thinking', 'Thinking...')} ({elapsed_str})")
+                self._set_status(f"⏺ {self._s_thinking} ({elapsed_str})")
 
     def _on_block_stop(self, event: dict, parent_id: str | None = None):
         index = event.get("index", -1)
-        block = self.active_blocks.pop(index, None)
+        slots = self.active_blocks
+        if not 0 <= index < len(slots):
+            return
+        block = slots[index]
         if not block:
             return
+        slots[index] = None  # keep the slot for the next message's block
 
-        if block["type"] == "thinking":
+        if block.type == "thinking":
             # Skip sub-agent thinking — only display main agent's
             if parent_id is not None:
                 return
-            text = "".join(block["text_parts"])
-            elapsed = time.time() - block.get("t0", time.time())
+            text = block.text_buf.decode("utf-8", "surrogatepass")
+            elapsed = time.time() - block.t0
             if text.strip():
                 if not config.debug:
                     self._stop_spin_timer()
                 with self._spin_lock:
-                    added = self._add_thinking_to_tree(text, block.get("t0", time.time()), elapsed)
+                    added = self._add_thinking_to_tree(text, block.t0, elapsed)
                     if added and not config.debug:
-                        self._rerender()
+                        self._request_rerender()
                 if not config.debug:
                     self._start_spin_timer()
-        elif block["type"] == "text":
-            text = "".join(block["text_parts"])
+        elif block.type == "text":
+            text = block.text_buf.decode("utf-8", "surrogatepass")
             if text.strip():
                 self.text_parts.append(text)
-        elif block["type"] == "tool_use":
-            name = block["name"]
-            raw_json = "".join(block["json_parts"])
+        elif block.type == "tool_use":
+            tool_id = block.id
+            if tool_id and tool_id in self.seen_tool_ids:
+                return  # already shown (verbose re-send) — skip the JSON parse
+            name = block.name
+            raw_json = block.json_buf  # both JSON backends parse UTF-8 bytes directly
             try:
-                input_data = json.loads(raw_json) if raw_json else {}
-            except json.JSONDecodeError:
+                input_data = _loads(raw_json) if raw_json else {}
+            except (json.JSONDecodeError, UnicodeDecodeError):
                 input_data = {}
-            self._display_tool(name, input_data, block.get("id", ""), parent_id)
+            self._display_tool(name, input_data, tool_id, parent_id)
 
     def _on_assistant_message(self, event: dict, parent_id: str | None = None):
         """Handle complete assistant message (--verbose mode).
@@ -869,14 +1166,13 @@ class StreamParser:
         content = message.get("content", [])
         if not isinstance(content, list) or not content:
             if self.header_printed:
-                self._set_status(_s("msg_thinking", "Thinking..."))
+                self._set_status(self._s_thinking)
             return
 
-        # Stop spin timer to prevent race with tree mutations
-        self._stop_spin_timer()
-
         added = False  # track if we added anything new
 
+        # Tree mutations happen under _spin_lock, which every spinner tick
+        # also takes, so the spinner can keep running through a re-broadcast.
         with self._spin_lock:
             now = time.time()
             for block in content:
@@ -893,7 +1189,6 @@ class StreamParser:
                     name = block.get("name", "")
                     input_data = block.get("input", {})
                     icon = TOOL_ICONS.get(name, "🔧")
-                    details = self._make_tool_details(name, input_data)
 
                     if parent_id is None:
                         self.tool_count += 1
@@ -901,19 +1196,20 @@ class StreamParser:
                             self.task_counter += 1
                             desc = input_data.get("description", "unknown task")
                             sub_model = input_data.get("model", "sonnet")
-                            self.root_items.append({
+                            task = {
                                 "type": "task", "icon": icon,
                                 "num": self.task_counter, "model": sub_model,
                                 "desc": desc, "tool_id": tool_id, "children": [],
                                 "status": "done", "t0": now, "elapsed": 0,
-                            })
-                            self.task_index[tool_id] = len(self.root_items) - 1
+                            }
+                            self.root_items.append(task)
+                            self.task_index[tool_id] = self._last_task = task
                         else:
                             summary = tool_summary(name, input_data)
                             self.root_items.append({
                                 "type": "tool", "icon": icon,
                                 "label": f"{name}: {summary}",
-                                "details": details,
+                                "tool": name, "input": input_data,
                                 "status": "done", "t0": now, "elapsed": 0,
                             })
                         added = True
@@ -921,11 +1217,11 @@ class StreamParser:
                         self.sub_tool_count += 1
                         summary = tool_summary(name, input_data)
                         child = {"icon": icon, "label": f"{name}: {summary}",
-                                 "details": details,
+                                 "tool": name, "input": input_data,
                                  "status": "done", "t0": now, "elapsed": 0}
-                        idx = self.task_index.get(parent_id)
-                        if idx is not None and idx < len(self.root_items):
-                            self.root_items[idx]["children"].append(child)
+                        task = self.task_index.get(parent_id)
+                        if task is not None:
+                            task["children"].append(child)
                             added = True
 
                     # Debug mode: append-only print (non-debug uses _rerender below)
@@ -943,23 +1239,21 @@ class StreamParser:
 
             # Rerender if something changed
             if added and self.header_printed and not config.debug:
-                last_running = None
-                for item in reversed(self.root_items):
-                    if item["type"] == "task":
-                        last_running = item
-                        break
+                last_running = self._last_task
                 if last_running:
                     self.status = (
                         f"#{last_running['num']} "
-                        f"{_s('msg_working_on', 'working...')} ({last_running['desc']})")
+                        f"{self._s_working_on} ({last_running['desc']})")
                 else:
-                    self.status = _s("msg_thinking", "Thinking...")
+                    self.status = self._s_thinking
                 self._status_base = self.status
                 self._status_start = time.time()
-                self._rerender()
+                self._request_rerender()
 
-        # Restart spin timer
-        if self.header_printed and not config.debug and self.status:
+        # Restart spin timer only if the tree changed (or none is running):
+        # a fully deduped re-broadcast leaves the current spinner untouched.
+        if (self.header_printed and not config.debug and self.status
+                and (added or self._spin_thread is None)):
             self._start_spin_timer()
 
     def _display_tool(
@@ -993,7 +1287,6 @@ class StreamParser:
                 self.seen_tool_ids.add(tool_id)
             self.tool_count += 1
             icon = TOOL_ICONS.get(name, "🔧")
-            details = self._make_tool_details(name, input_data)
             now = time.time()
 
             if parent_id is None:
@@ -1001,52 +1294,53 @@ class StreamParser:
                     self.task_counter += 1
                     desc = input_data.get("description", "unknown task")
                     sub_model = input_data.get("model", "sonnet")
-                    self.root_items.append({
+                    task = {
                         "type": "task", "icon": icon,
                         "num": self.task_counter, "model": sub_model,
                         "desc": desc, "tool_id": tool_id, "children": [],
                         "status": "running", "t0": now,
-                    })
-                    self.task_index[tool_id] = len(self.root_items) - 1
+                    }
+                    self.root_items.append(task)
+                    self.task_index[tool_id] = self._last_task = task
                 else:
                     summary = tool_summary(name, input_data)
                     self.root_items.append({
                         "type": "tool", "icon": icon,
                         "label": f"{name}: {summary}",
-                        "details": details,
+                        "tool": name, "input": input_data,
                         "status": "running", "t0": now,
                     })
             else:
                 self.sub_tool_count += 1
                 summary = tool_summary(name, input_data)
                 child = {"icon": icon, "label": f"{name}: {summary}",
-                         "details": details,
+                         "tool": name, "input": input_data,
                          "status": "running", "t0": now}
-                idx = self.task_index.get(parent_id)
-                if idx is not None and idx < len(self.root_items):
-                    self.root_items[idx]["children"].append(child)
+                task = self.task_index.get(parent_id)
+                if task is not None:
+                    task["children"].append(child)
                 else:
                     self.root_items.append({
                         "type": "tool", "icon": icon,
                         "label": f"[sub] {name}: {summary}",
-                        "details": details,
+                        "tool": name, "input": input_data,
                         "status": "running", "t0": now,
                     })
 
             # Update status
             if parent_id is None:
                 if name == "Task":
-                    self.status = f"#{self.task_counter} {_s('msg_subagent_start', 'Sub-agent starting...')}"
+                    self.status = f"#{self.task_counter} {self._s_subagent_start}"
                 else:
-                    self.status = f"{name} {_s('msg_tool_running', 'running...')}"
+                    self.status = f"{name} {self._s_tool_running}"
             else:
-                idx = self.task_index.get(parent_id)
-                tnum = self.root_items[idx]["num"] if idx is not None else "?"
-                self.status = f"#{tnum} {name} {_s('msg_tool_running', 'running...')}"
+                task = self.task_index.get(parent_id)
+                tnum = task["num"] if task is not None else "?"
+                self.status = f"#{tnum} {name} {self._s_tool_running}"
 
             self._status_base = self.status
             self._status_start = time.time()
-            self._rerender()
+            self._request_rerender()
 
         self._start_spin_timer()
 
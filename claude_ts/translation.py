@@ -2,32 +2,37 @@
 
 from __future__ import annotations
 
+import atexit
+import json
 import re
 import subprocess
 import sys
+import threading
+import time
+from collections import deque
+from typing import Callable, Iterable
 
 from claude_ts.state import (
-    config, clean_env, load_language, detect_language, get_ui_string,
+    config, clean_env, load_language, detect_language, get_ui_string, _loads,
     MAX_CONTEXT_TURNS, MAX_CONTEXT_CHARS,
 )
 from claude_ts.ui import C, error
-from claude_ts.ollama import _ollama_generate
 
 
 # ── Translation Prompt Suffixes (language-agnostic) ─────────────────────────
 
 _TO_EN_SUFFIX_CTX = """
 <context>
-{context}
+%s
 </context>
 <translate>
-{text}
+%s
 </translate>
 """
 
 _TO_EN_SUFFIX = """
 <translate>
-{text}
+%s
 </translate>
 """
 
@@ -35,6 +40,8 @@ _TO_EN_SUFFIX = """
 # ── Link Handling ───────────────────────────────────────────────────────────
 
 _MD_LINK_RE = re.compile(r'\[([^\]]+)\]\((https?://[^)]+)\)')
+# Backticks only as a pair, so inline code next to a bare placeholder survives
+_LINK_PLACEHOLDER_RE = re.compile(r"`\[LINK:(\d+)\]`|\[LINK:(\d+)\]")
 
 
 def _shield_links(text: str) -> tuple[str, list[tuple[str, str]]]:
@@ -50,47 +57,60 @@ def _shield_links(text: str) -> tuple[str, list[tuple[str, str]]]:
 
 
 def _unshield_links(text: str, links: list[tuple[str, str]]) -> str:
-    """Restore markdown links from placeholders."""
-    for i, (title, url) in enumerate(links):
-        text = text.replace(f"`[LINK:{i}]`", f"[{title}]({url})")
-        text = text.replace(f"[LINK:{i}]", f"[{title}]({url})")
-    return text
+    """Restore markdown links from placeholders in a single pass."""
+
+    def _repl(m: re.Match) -> str:
+        i = int(m.group(1) or m.group(2))
+        if i >= len(links):
+            return m.group(0)  # placeholder the translator made up — leave as is
+        title, url = links[i]
+        return f"[{title}]({url})"
+
+    return _LINK_PLACEHOLDER_RE.sub(_repl, text)
 
 
 # ── Helpers ─────────────────────────────────────────────────────────────────
 
+_HANGUL_RE = re.compile(r"[\uAC00-\uD7AF\u1100-\u11FF\u3130-\u318F]")
+
+
 def contains_target_language(text: str) -> bool:
     """Check if text contains characters from the configured language."""
     if not config.language:
         # Fallback: Korean detection for backwards compatibility
-        return bool(re.search(r"[\uAC00-\uD7AF\u1100-\u11FF\u3130-\u318F]", text))
+        return not text.isascii() and _HANGUL_RE.search(text) is not None
     try:
         lang_data = load_language(config.language)
-        return bool(re.search(lang_data["detect_regex"], text))
+        if not lang_data["_detect_ascii"] and text.isascii():
+            return False
+        return bool(lang_data["_detect_re"].search(text))
     except (FileNotFoundError, KeyError):
         return False
 
 
 
 
-def _build_context_block(conversation_context: list[dict[str, str]]) -> str:
-    """Build a short context summary from recent conversation turns."""
+def _build_context_block(conversation_context: Iterable[dict[str, str]]) -> str:
+    """Build a short context summary from recent conversation turns.
+
+    Turns are walked newest first and stop once MAX_CONTEXT_CHARS is covered,
+    so older lines that would be cut off anyway are never formatted.
+    """
     if not conversation_context:
         return ""
-    lines = []
-    for i, turn in enumerate(conversation_context[-MAX_CONTEXT_TURNS:]):
-        u = turn.get("user", "")
-        a = turn.get("assistant", "")
-        if u:
-            u_short = u[:150] + ("..." if len(u) > 150 else "")
-            lines.append(f"Q{i+1}: {u_short}")
-        if a:
-            a_short = a[:150] + ("..." if len(a) > 150 else "")
-            lines.append(f"A{i+1}: {a_short}")
-    block = "\n".join(lines)
-    if len(block) > MAX_CONTEXT_CHARS:
-        block = block[-MAX_CONTEXT_CHARS:]
-    return block
+    turns = list(conversation_context)[-MAX_CONTEXT_TURNS:]
+    lines: deque[str] = deque()
+    total = -1  # no newline before the first line
+    for i in range(len(turns) - 1, -1, -1):
+        for label, key in (("A", "assistant"), ("Q", "user")):
+            msg = turns[i].get(key, "")
+            if msg:
+                line = f"{label}{i+1}: {msg[:150]}" + ("..." if len(msg) > 150 else "")
+                lines.appendleft(line)
+                total += len(line) + 1
+        if total >= MAX_CONTEXT_CHARS:
+            break
+    return "\n".join(lines)[-MAX_CONTEXT_CHARS:]
 
 
 def _get_prompts() -> tuple[str, str]:
@@ -102,11 +122,145 @@ def _get_prompts() -> tuple[str, str]:
     return lang_data["to_en_prompt"], lang_data["from_en_prompt"]
 
 
+# ── Claude Worker ───────────────────────────────────────────────────────────
+
+def _discard(proc: subprocess.Popen):
+    proc.kill()
+    proc.communicate()
+
+
+class _ClaudeWorker:
+    """Keeps the next translation's `claude -p` process started ahead of time.
+
+    claude -p answers one prompt per process, so each translation still gets
+    its own process, but with prespawn on (interactive REPL only) the next one
+    is spawned as soon as the current one is taken and its Node start-up
+    overlaps with the rest of the turn. With --input-format stream-json the
+    spare waits on stdin for as long as needed.
+    """
+
+    __slots__ = ("_proc", "_model", "_lock", "prespawn")
+
+    def __init__(self):
+        self._proc: subprocess.Popen | None = None
+        self._model: str = ""
+        self._lock = threading.Lock()
+        self.prespawn: bool = False
+
+    @staticmethod
+    def _spawn(model: str) -> subprocess.Popen:
+        return subprocess.Popen(
+            ["claude", "-p", "--model", model,
+             "--input-format", "stream-json", "--output-format", "stream-json", "--verbose"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            env=clean_env(),
+        )
+
+    def take(self, model: str) -> subprocess.Popen:
+        """A running process for model, leaving a fresh spare behind if prespawn is on.
+
+        Failing to start the process to use raises (FileNotFoundError means
+        claude is missing). Failing to start the spare is not an error for
+        this call: no spare is kept, and the next take() spawns on demand and
+        raises then.
+        """
+        with self._lock:
+            proc, self._proc = self._proc, None
+            if proc is not None and (proc.poll() is not None or self._model != model):
+                _discard(proc)
+                proc = None
+            if proc is None:
+                proc = self._spawn(model)
+            if self.prespawn:
+                try:
+                    self._proc = self._spawn(model)
+                    self._model = model
+                except OSError:
+                    pass
+        return proc
+
+    def close(self):
+        """Kill the spare process (REPL exit, and at interpreter exit)."""
+        with self._lock:
+            proc, self._proc = self._proc, None
+        if proc is not None:
+            _discard(proc)
+
+
+_worker = _ClaudeWorker()
+close_translation_worker = _worker.close
+atexit.register(_worker.close)  # sys.exit and uncaught errors skip the REPL cleanup
+
+
+def enable_translation_prespawn():
+    """Keep a spare claude process for the next translation (interactive use)."""
+    _worker.prespawn = True
+
+
+def _run_claude(prompt: str, model: str,
+                cancel: threading.Event | None = None) -> tuple[int, str, str]:
+    """Send one prompt to a claude process. Returns (returncode, text, stderr).
+
+    Raises subprocess.TimeoutExpired after 120s, or soon after cancel is set;
+    the process is killed either way.
+    """
+    proc = _worker.take(model)
+    pending: str | None = json.dumps(
+        {"type": "user", "message": {"role": "user", "content": prompt}}) + "\n"
+    deadline = time.monotonic() + 120
+    while True:
+        wait = deadline - time.monotonic()
+        if cancel is not None:
+            wait = min(wait, 0.2)
+        try:
+            out, err = proc.communicate(pending, timeout=max(wait, 0))
+            break
+        except subprocess.TimeoutExpired:
+            pending = None  # already sent; communicate() resumes reading
+            if time.monotonic() >= deadline or (cancel is not None and cancel.is_set()):
+                _discard(proc)
+                raise
+    for line in reversed(out.splitlines()):
+        if '"result"' not in line:
+            continue
+        try:
+            event = _loads(line)
+        except json.JSONDecodeError:
+            continue
+        if event.get("type") == "result":
+            text = "" if event.get("is_error") else event.get("result") or ""
+            return proc.returncode, text, err
+    return proc.returncode, "", err
+
+
 # ── Translation Engine ──────────────────────────────────────────────────────
 
 def translate(text: str, direction: str,
-              conversation_context: list[dict[str, str]] | None = None) -> str:
+              conversation_context: Iterable[dict[str, str]] | None = None) -> str:
     """Translate text via claude -p --model haiku (stdin-based)."""
+    translated, report = translate_deferred(text, direction, conversation_context)
+    if report is not None:
+        report()
+    return translated
+
+
+def translate_deferred(
+    text: str, direction: str,
+    conversation_context: Iterable[dict[str, str]] | None = None,
+    cancel: threading.Event | None = None,
+) -> tuple[str, Callable[[], None] | None]:
+    """translate() without terminal output, for use off the main thread.
+
+    Returns (result, report): on failure result is the original text and
+    report prints the error (and exits if claude is missing); it must be
+    called on the main thread. Setting cancel kills a running claude call.
+    """
+    if not text.strip():
+        return text, None  # nothing to translate — skip the round-trip
+
     to_en_prompt, from_en_prompt = _get_prompts()
 
     # Protect markdown links from being mangled during en→target translation
@@ -117,51 +271,49 @@ def translate(text: str, direction: str,
     if direction == "kr2en":
         ctx = _build_context_block(conversation_context or [])
         if ctx:
-            prompt = to_en_prompt + _TO_EN_SUFFIX_CTX.format(
-                context=ctx, text=text
-            )
+            prompt = to_en_prompt + _TO_EN_SUFFIX_CTX % (ctx, text)
         else:
-            prompt = to_en_prompt + _TO_EN_SUFFIX.format(text=text)
+            prompt = to_en_prompt + _TO_EN_SUFFIX % text
     else:
         prompt = from_en_prompt + f"\n<translate>\n{text}\n</translate>"
 
     # ── Ollama backend ──
     if config.translate_backend == "ollama" and config.ollama_model:
+        from claude_ts.ollama import _ollama_generate
         if direction == "kr2en":
             ollama_system = to_en_prompt
         else:
             ollama_system = from_en_prompt
-        translated = _ollama_generate(text, config.ollama_model, system=ollama_system)
+        translated, err_msg = _ollama_generate(text, config.ollama_model, system=ollama_system)
         if translated:
             if shielded_links:
                 translated = _unshield_links(translated, shielded_links)
-            return translated
-        error(get_ui_string("translation_failed", "Translation failed — returning original"))
-        return text
+            return translated, None
+
+        def report():
+            if err_msg:
+                error(err_msg)
+            error(get_ui_string("translation_failed", "Translation failed — returning original"))
+        return text, report
 
     # ── Claude backend (default) ──
     try:
-        result = subprocess.run(
-            ["claude", "-p", "--model", config.translate_model],
-            input=prompt,
-            capture_output=True,
-            text=True,
-            env=clean_env(),
-            timeout=120,
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            translated = result.stdout.strip()
-            if shielded_links:
-                translated = _unshield_links(translated, shielded_links)
-            return translated
-        else:
-            error(f"{get_ui_string('translation_failed', 'Translation failed')} (exit: {result.returncode})")
-            if config.debug and result.stderr:
-                print(f"{C.DIM}{result.stderr}{C.RESET}", file=sys.stderr)
-            return text
+        returncode, stdout, stderr = _run_claude(prompt, config.translate_model, cancel)
     except subprocess.TimeoutExpired:
-        error(get_ui_string("translation_timeout", "Translation timeout (120s)"))
-        return text
+        return text, lambda: error(get_ui_string("translation_timeout", "Translation timeout (120s)"))
     except FileNotFoundError:
-        error(get_ui_string("claude_not_found", "claude command not found"))
-        sys.exit(1)
+        def report():
+            error(get_ui_string("claude_not_found", "claude command not found"))
+            sys.exit(1)
+        return text, report
+    if returncode == 0 and stdout.strip():
+        translated = stdout.strip()
+        if shielded_links:
+            translated = _unshield_links(translated, shielded_links)
+        return translated, None
+
+    def report():
+        error(f"{get_ui_string('translation_failed', 'Translation failed')} (exit: {returncode})")
+        if config.debug and stderr:
+            print(f"{C.DIM}{stderr}{C.RESET}", file=sys.stderr)
+    return text, report
@@ -2,28 +2,32 @@
 
 from __future__ import annotations
 
+import os
 import sys
 import threading
 
-from rich.console import Console
-from rich.markdown import Markdown
-from rich.padding import Padding
-from rich.theme import Theme
-
-from claude_ts.state import config
+from claude_ts.state import config, _s
 
 
 # ── Rich console ────────────────────────────────────────────────────────────
+# rich (and the pygments lexers it pulls in) is imported on the first
+# render, so start-up, the banner and the spinner don't pay for it.
 
-_theme = Theme({"markdown.heading": "bold cyan"})
-console = Console(theme=_theme, highlight=False)
+_console = None  # rich.console.Console, created on first render
 
 
 def render_markdown(text: str):
     """Render markdown text to the terminal."""
-    console.print(
+    global _console
+    from rich.markdown import Markdown
+    from rich.padding import Padding
+    if _console is None:
+        from rich.console import Console
+        from rich.theme import Theme
+        _console = Console(theme=Theme({"markdown.heading": "bold cyan"}), highlight=False)
+    _console.print(
         Padding(Markdown(text), (0, 0, 0, 2)),
-        width=min(console.width, 100),
+        width=min(_console.width, 100),
     )
 
 
@@ -48,7 +52,6 @@ def dim(msg: str):
 
 
 def error(msg: str):
-    from claude_ts.state import _s
     print(f"  {C.RED}[{_s('err_prefix', 'Error')}] {msg}{C.RESET}", file=sys.stderr, flush=True)
 
 
@@ -80,8 +83,16 @@ class SpinnerContext:
         self.msg = msg
         self._stop = threading.Event()
         self._thread: threading.Thread | None = None
+        self._frames: tuple[bytes, ...] = ()
 
     def __enter__(self):
+        # Frames are rendered once and written straight to the fd, so the
+        # loop neither formats strings nor takes the sys.stdout lock.
+        self._frames = tuple(
+            f"\r  {C.DIM}{ch} {self.msg}{C.RESET}\033[K".encode("utf-8")
+            for ch in SPINNER
+        )
+        sys.stdout.flush()
         self._stop.clear()
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
@@ -95,10 +106,16 @@ class SpinnerContext:
         sys.stdout.flush()
 
     def _run(self):
+        try:
+            fd = sys.stdout.fileno()
+        except (AttributeError, OSError, ValueError):
+            return  # stdout is not a real file — nothing to animate
+        frames = self._frames
         idx = 0
         while not self._stop.is_set():
-            ch = SPINNER[idx % len(SPINNER)]
-            sys.stdout.write(f"\r  {C.DIM}{ch} {self.msg}{C.RESET}\033[K")
-            sys.stdout.flush()
+            try:
+                os.write(fd, frames[idx % len(frames)])
+            except OSError:
+                return
             idx += 1
             self._stop.wait(0.08)
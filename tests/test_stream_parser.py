@@ -0,0 +1,32 @@
+"""Tests for the thinking-preview tail tracking in stream_parser."""
+
+from claude_ts.stream_parser import _thinking_tail
+
+
+def _preview_line(full: str) -> str:
+    """The preview line computed from the whole block, as before tracking."""
+    return full.rstrip().rsplit("\n", 1)[-1].strip()
+
+
+def _feed(deltas: list[str]) -> str:
+    tail = ""
+    for text in deltas:
+        tail = _thinking_tail(tail, text)
+    return tail
+
+
+def test_newline_ending_long_line_at_delta_boundary():
+    deltas = ["a" + "y" * 300 + "\n", "x" * 10]
+    assert _feed(deltas).strip() == "x" * 10 == _preview_line("".join(deltas))
+
+
+def test_paragraph_break_after_long_line():
+    deltas = ["a" + "y" * 300, "\n\n", "next paragraph"]
+    assert _feed(deltas).strip() == "next paragraph"
+
+
+def test_long_line_keeps_preview_head():
+    deltas = ["start " + "y" * 300, " more"]
+    tail = _feed(deltas)
+    assert len(tail) <= 258
+    assert tail.strip()[:50] == _preview_line("".join(deltas))[:50]